@@ -1,9 +1,44 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List, Optional, Sequence, Tuple
 
 
 class LLMClient(ABC):
     @abstractmethod
-    def choose_answer(self, question: str, options: List[str]) -> str:
-        """Return the model's suggested answer for the given question/options."""
+    def choose_answer(
+        self,
+        question: str,
+        options: List[str],
+        context: Optional[str] = None,
+    ) -> str:
+        """Return the model's suggested answer for the given question/options.
+
+        If context is provided, it is sent as an invariant prefix (e.g. the book
+        transcript) shared across questions rather than embedded in the question.
+        """
         raise NotImplementedError
+
+    def choose_answer_stream(
+        self,
+        question: str,
+        options: List[str],
+        context: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Yield the suggested answer incrementally as text fragments.
+
+        The default implementation yields the complete answer in one piece;
+        clients with streaming APIs may override it to reduce perceived
+        latency.
+        """
+        yield self.choose_answer(question, options, context)
+
+    def choose_answers(
+        self,
+        batch: Sequence[Tuple[str, List[str]]],
+        context: Optional[str] = None,
+    ) -> List[str]:
+        """Answer a batch of (question, options) pairs.
+
+        The default implementation is sequential; clients may override it to
+        overlap requests.
+        """
+        return [self.choose_answer(question, options, context) for question, options in batch]
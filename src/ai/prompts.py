@@ -1,11 +1,30 @@
+import string
 from typing import List
 
+LETTERS = tuple(string.ascii_uppercase)
+
+# Kept terse (every byte is billed as input tokens on each request) and
+# byte-identical across requests so providers that cache exact prompt
+# prefixes (system + context messages) can reuse their cache between questions.
+SYSTEM_MESSAGE = "Pick the best answer option; reply with the letter and full option text."
+
+
+def build_context_message(book_context: str) -> str:
+    return (
+        "Use the following book transcript to answer the quiz questions.\n\n"
+        f"Book transcript:\n{book_context}"
+    )
+
 
 def build_quiz_prompt(question: str, options: List[str]) -> str:
-    lines = ["Question:", question, "", "Options:"]
-    for index, option in enumerate(options):
-        letter = chr(ord("A") + index)
-        lines.append(f"{letter}. {option}")
-    lines.append("")
-    lines.append("Choose the single best option and answer with the letter and full option text.")
-    return "\n".join(lines)
+    return "\n".join(
+        [
+            "Question:",
+            question,
+            "",
+            "Options:",
+            *[f"{LETTERS[index]}. {option}" for index, option in enumerate(options)],
+            "",
+            "Choose the single best option and answer with the letter and full option text.",
+        ]
+    )
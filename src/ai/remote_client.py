@@ -1,43 +1,95 @@
+import hashlib
+import json
 import logging
-from typing import List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Sequence, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from config.settings import LLMConfig
 from .base import LLMClient
-from .prompts import build_quiz_prompt
+from .prompts import SYSTEM_MESSAGE, build_context_message, build_quiz_prompt
+
+
+_CACHE_MAX_ENTRIES = 512
 
 
 class RemoteLLMClient(LLMClient):
     def __init__(self, config: LLMConfig) -> None:
         self._config = config
+        # Exact-match response cache so retakes and duplicate questions skip
+        # the HTTP round trip (and its token cost) entirely.
+        self._response_cache: OrderedDict[str, str] = OrderedDict()
+        # Reuse a single keep-alive session so each quiz question does not pay
+        # for a fresh TCP+TLS handshake to the provider.
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        self._session.headers.update(
+            {
+                "Authorization": f"Bearer {self._config.api_key}",
+                "Content-Type": "application/json",
+            }
+        )
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def warm_up(self) -> None:
+        """Pre-establish a pooled TLS connection to the provider.
+
+        Best-effort: a cheap GET leaves a warm keep-alive socket in the pool
+        so the first real completion request skips the handshake.
+        """
+        try:
+            self._session.get(f"{self._config.base_url}/models", timeout=10)
+        except requests.RequestException as exc:
+            logging.debug("LLM warm-up request failed: %s", exc)
+
+    def _cache_key(self, question: str, options: List[str], context: Optional[str]) -> str:
+        payload = json.dumps(
+            [self._config.model, context, question, options],
+            sort_keys=True,
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def choose_answer(
+        self,
+        question: str,
+        options: List[str],
+        context: Optional[str] = None,
+    ) -> str:
+        key = self._cache_key(question, options, context)
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            self._response_cache.move_to_end(key)
+            logging.info("LLM response served from cache.")
+            return cached
 
-    def choose_answer(self, question: str, options: List[str]) -> str:
         prompt = build_quiz_prompt(question, options)
 
+        # The system message and the book-transcript context form an invariant
+        # prefix; only the final user message varies between questions, so
+        # providers with prefix-based prompt caching get a hit on every
+        # question after the first.
+        messages = [{"role": "system", "content": SYSTEM_MESSAGE}]
+        if context:
+            messages.append({"role": "system", "content": build_context_message(context)})
+        messages.append({"role": "user", "content": prompt})
+
+        # Temperature is left at the provider default; sending it would only
+        # add payload bytes. Compact separators shave whitespace from the
+        # serialized body.
         payload = {
             "model": self._config.model,
-            "messages": [
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a reading comprehension assistant. "
-                        "Choose the single best answer option and respond with the option "
-                        "letter and the full option text."
-                    ),
-                },
-                {"role": "user", "content": prompt},
-            ],
-            "temperature": 0.2,
-        }
-
-        headers = {
-            "Authorization": f"Bearer {self._config.api_key}",
-            "Content-Type": "application/json",
+            "messages": messages,
         }
 
         url = f"{self._config.base_url}/chat/completions".rstrip("/")
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
+        body = json.dumps(payload, separators=(",", ":"))
+        response = self._session.post(url, data=body, timeout=30)
         response.raise_for_status()
         data = response.json()
 
@@ -47,4 +99,86 @@ class RemoteLLMClient(LLMClient):
             logging.error("Unexpected LLM response format: %s", data)
             raise RuntimeError("LLM response format error") from exc
 
+        self._response_cache[key] = content
+        if len(self._response_cache) > _CACHE_MAX_ENTRIES:
+            self._response_cache.popitem(last=False)
+
         return content
+
+    def choose_answer_stream(
+        self,
+        question: str,
+        options: List[str],
+        context: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Yield the answer as it is generated instead of after completion.
+
+        Uses the provider's SSE streaming mode, so the caller can surface the
+        first tokens after the time-to-first-token instead of waiting for the
+        full generation. Cached answers are yielded whole.
+        """
+        key = self._cache_key(question, options, context)
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            self._response_cache.move_to_end(key)
+            logging.info("LLM response served from cache.")
+            yield cached
+            return
+
+        prompt = build_quiz_prompt(question, options)
+        messages = [{"role": "system", "content": SYSTEM_MESSAGE}]
+        if context:
+            messages.append({"role": "system", "content": build_context_message(context)})
+        messages.append({"role": "user", "content": prompt})
+
+        payload = {
+            "model": self._config.model,
+            "messages": messages,
+            "stream": True,
+        }
+
+        url = f"{self._config.base_url}/chat/completions".rstrip("/")
+        body = json.dumps(payload, separators=(",", ":"))
+        parts: List[str] = []
+        with self._session.post(url, data=body, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                try:
+                    delta = json.loads(data)["choices"][0]["delta"].get("content")
+                except (ValueError, KeyError, IndexError):
+                    continue
+                if delta:
+                    parts.append(delta)
+                    yield delta
+
+        content = "".join(parts).strip()
+        if content:
+            self._response_cache[key] = content
+            if len(self._response_cache) > _CACHE_MAX_ENTRIES:
+                self._response_cache.popitem(last=False)
+
+    def choose_answers(
+        self,
+        batch: Sequence[Tuple[str, List[str]]],
+        context: Optional[str] = None,
+    ) -> List[str]:
+        """Answer several questions with overlapping requests.
+
+        Requests run on a small thread pool over the shared keep-alive
+        session, so N questions cost roughly one round trip instead of N.
+        Results are returned in batch order.
+        """
+        if len(batch) <= 1:
+            return [self.choose_answer(q, opts, context) for q, opts in batch]
+
+        with ThreadPoolExecutor(max_workers=min(8, len(batch))) as executor:
+            futures = [
+                executor.submit(self.choose_answer, question, options, context)
+                for question, options in batch
+            ]
+            return [future.result() for future in futures]
@@ -1,6 +1,8 @@
+import json
 import logging
 import os
 import shutil
+import subprocess
 import sys
 import tempfile
 from pathlib import Path
@@ -13,6 +15,85 @@ from webdriver_manager.chrome import ChromeDriverManager
 from config.settings import AutomationConfig
 
 
+_CHROMEDRIVER_CACHE_FILE = Path.home() / ".cache" / "slz" / "chromedriver_path.json"
+
+
+def _tune_command_executor(driver: webdriver.Chrome) -> None:
+    """Give the chromedriver HTTP client a keep-alive pool with headroom.
+
+    The auto-read loop issues hundreds of execute_script calls; reusing
+    pooled connections shaves a few milliseconds from each command.
+    """
+    try:
+        import urllib3
+
+        executor = driver.command_executor
+        executor._conn = urllib3.PoolManager(num_pools=1, maxsize=8, block=False)
+    except Exception as exc:  # noqa: BLE001
+        logging.debug("Could not tune chromedriver connection pool: %s", exc)
+
+
+def _finalize_driver(driver: webdriver.Chrome) -> webdriver.Chrome:
+    _tune_command_executor(driver)
+    driver.maximize_window()
+    return driver
+
+
+def _chrome_version(chrome_binary: str) -> str:
+    binary = (
+        chrome_binary
+        or shutil.which("google-chrome")
+        or shutil.which("chromium-browser")
+        or shutil.which("chromium")
+        or ""
+    )
+    if not binary:
+        return ""
+    try:
+        result = subprocess.run(
+            [binary, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        return result.stdout.strip()
+    except Exception:  # noqa: BLE001
+        return ""
+
+
+def _resolve_webdriver_manager_driver(chrome_binary: str) -> str:
+    """Resolve the chromedriver path, reusing a cached result across runs.
+
+    ChromeDriverManager().install() re-probes the network for the latest
+    driver version on every run; caching the resolved path keyed by the
+    installed Chrome version saves several seconds of startup.
+    """
+    chrome_version = _chrome_version(chrome_binary)
+    try:
+        entry = json.loads(_CHROMEDRIVER_CACHE_FILE.read_text(encoding="utf-8"))
+        cached_path = entry.get("path", "")
+        if (
+            cached_path
+            and entry.get("chrome_version") == chrome_version
+            and Path(cached_path).exists()
+        ):
+            logging.info("Using cached ChromeDriver at %s", cached_path)
+            return cached_path
+    except Exception:  # noqa: BLE001
+        pass
+
+    driver_path = ChromeDriverManager().install()
+    try:
+        _CHROMEDRIVER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _CHROMEDRIVER_CACHE_FILE.write_text(
+            json.dumps({"path": driver_path, "chrome_version": chrome_version}),
+            encoding="utf-8",
+        )
+    except Exception:  # noqa: BLE001
+        pass
+    return driver_path
+
+
 def _is_snap_chromedriver_wrapper(path: str) -> bool:
     try:
         wrapper = Path(path)
@@ -84,8 +165,7 @@ def _create_snap_chromium_driver(options: ChromeOptions) -> webdriver.Chrome:
 
     options.binary_location = str(snap_browser)
     driver = webdriver.Chrome(service=service, options=options)
-    driver.maximize_window()
-    return driver
+    return _finalize_driver(driver)
 
 
 def create_driver(config: AutomationConfig, driver_mode: str = "auto") -> webdriver.Chrome:
@@ -114,8 +194,7 @@ def create_driver(config: AutomationConfig, driver_mode: str = "auto") -> webdri
             logging.info("Using CHROME_BINARY=%s", chrome_binary)
             options.binary_location = chrome_binary
         driver = webdriver.Chrome(service=service, options=options)
-        driver.maximize_window()
-        return driver
+        return _finalize_driver(driver)
 
     chromedriver_on_path = shutil.which("chromedriver")
     chromedriver_candidate = chromedriver_on_path or "/usr/bin/chromedriver"
@@ -136,18 +215,16 @@ def create_driver(config: AutomationConfig, driver_mode: str = "auto") -> webdri
             logging.info("Using CHROME_BINARY=%s", chrome_binary)
             options.binary_location = chrome_binary
         driver = webdriver.Chrome(options=options)
-        driver.maximize_window()
-        return driver
+        return _finalize_driver(driver)
 
     if mode in ("webdriver-manager", "wdm"):
         logging.info("Using webdriver-manager ChromeDriver download")
-        service = ChromeService(ChromeDriverManager().install())
+        service = ChromeService(_resolve_webdriver_manager_driver(chrome_binary))
         if chrome_binary:
             logging.info("Using CHROME_BINARY=%s", chrome_binary)
             options.binary_location = chrome_binary
         driver = webdriver.Chrome(service=service, options=options)
-        driver.maximize_window()
-        return driver
+        return _finalize_driver(driver)
 
     if driver_path:
         logging.info("Auto mode: using CHROMEDRIVER_PATH=%s", driver_path)
@@ -156,8 +233,7 @@ def create_driver(config: AutomationConfig, driver_mode: str = "auto") -> webdri
             logging.info("Using CHROME_BINARY=%s", chrome_binary)
             options.binary_location = chrome_binary
         driver = webdriver.Chrome(service=service, options=options)
-        driver.maximize_window()
-        return driver
+        return _finalize_driver(driver)
 
     if chromedriver_is_snap_wrapper:
         logging.info("Auto mode: detected snap-wrapper chromedriver; using snap Chromium backend")
@@ -170,10 +246,8 @@ def create_driver(config: AutomationConfig, driver_mode: str = "auto") -> webdri
     if not chromedriver_on_path:
         logging.info("Auto mode: no chromedriver on PATH; using Selenium Manager")
         driver = webdriver.Chrome(options=options)
-        driver.maximize_window()
-        return driver
+        return _finalize_driver(driver)
 
     logging.info("Auto mode: using chromedriver on PATH: %s", chromedriver_on_path)
     driver = webdriver.Chrome(options=options)
-    driver.maximize_window()
-    return driver
+    return _finalize_driver(driver)
@@ -1,13 +1,23 @@
-import io
+import base64
+import hashlib
+import json
 import logging
 import os
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple
 
+import cv2
 import easyocr
 import numpy as np
-from PIL import Image
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as EC
@@ -18,16 +28,39 @@ from config.settings import AppConfig
 
 
 def login(driver: WebDriver, app_config: AppConfig) -> None:
-    """Open SLZ and let the user perform login manually in the browser window."""
+    """Open SLZ and let the user perform login manually in the browser window.
+
+    Instead of blocking on the console, the function watches the DOM and
+    returns as soon as a logged-in marker (books list / dashboard) appears,
+    so the user never has to alt-tab back to the terminal.
+    """
     logging.info("Opening Scholastic Learning Zone at %s", app_config.slz.base_url)
     driver.get(app_config.slz.base_url)
 
+    try:
+        _install_slz_helpers(driver)
+    except Exception:  # noqa: BLE001
+        pass
+
     logging.info(
         "Please log in manually in the opened browser window. "
-        "After you are fully logged in and can see your books, "
-        "return to this console and press Enter to continue."
+        "The automation continues on its own once your books are visible."
     )
-    input("When you are logged in, press Enter here to continue...")
+    try:
+        WebDriverWait(driver, 600, poll_frequency=1.0).until(
+            EC.any_of(
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, ".books-list, .dashboard, app-bookshelf")
+                ),
+                EC.url_contains("/bookshelf"),
+            )
+        )
+        logging.info("Logged-in state detected; continuing.")
+    except TimeoutException:
+        logging.warning(
+            "No logged-in state detected within 10 minutes; falling back to manual confirmation.",
+        )
+        input("When you are logged in, press Enter here to continue...")
 
 
 def fill_login_form(driver: WebDriver, app_config: AppConfig) -> None:
@@ -44,8 +77,43 @@ def fill_login_form(driver: WebDriver, app_config: AppConfig) -> None:
     )
     wait = WebDriverWait(driver, 20)
 
+    # One script sets both fields through the native value setter and fires
+    # input/change events (the Angular form tracks those), replacing the
+    # find/clear/send_keys sequence — six WebDriver round-trips — with one.
+    script = """
+return (function(userVal, passVal) {
+  function setVal(selector, value) {
+    var el = document.querySelector(selector);
+    if (!el) { return false; }
+    try { el.focus(); } catch (e) {}
+    try {
+      var desc = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value');
+      if (desc && desc.set) {
+        desc.set.call(el, value);
+      } else {
+        el.value = value;
+      }
+    } catch (e) {
+      el.value = value;
+    }
+    try {
+      el.dispatchEvent(new Event('input', { bubbles: true }));
+      el.dispatchEvent(new Event('change', { bubbles: true }));
+    } catch (e) {}
+    return true;
+  }
+
+  var okUser = setVal("input[name='username'], input[formcontrolname='username']", userVal);
+  var okPass = setVal(
+    "input[type='password'], input[name='password'], input[formcontrolname='password']",
+    passVal,
+  );
+  return okUser && okPass;
+})(arguments[0], arguments[1]);
+"""
+
     try:
-        username_input = wait.until(
+        wait.until(
             EC.presence_of_element_located(
                 (
                     By.CSS_SELECTOR,
@@ -53,23 +121,16 @@ def fill_login_form(driver: WebDriver, app_config: AppConfig) -> None:
                 )
             )
         )
-        password_input = wait.until(
-            EC.presence_of_element_located(
-                (
-                    By.CSS_SELECTOR,
-                    "input[type='password'], input[name='password'], input[formcontrolname='password']",
-                )
-            )
-        )
-
-        username_input.clear()
-        username_input.send_keys(app_config.username)
-        password_input.clear()
-        password_input.send_keys(app_config.password)
 
-        logging.info(
-            "Login form fields filled. Please review in Chrome and click the Login button manually.",
+        filled = bool(
+            driver.execute_script(script, app_config.username, app_config.password),
         )
+        if filled:
+            logging.info(
+                "Login form fields filled. Please review in Chrome and click the Login button manually.",
+            )
+        else:
+            logging.warning("Unable to locate login inputs to fill form.")
     except (TimeoutException, NoSuchElementException) as exc:
         logging.warning("Unable to locate login inputs to fill form: %s", exc)
     except Exception as exc:  # noqa: BLE001
@@ -97,16 +158,21 @@ def auto_read_with_progress(
         logging.warning("Auto-read skipped: total_seconds or step_seconds not positive.")
         return
 
-    steps = max(1, int(total_seconds / step_seconds))
     logging.info(
         "Starting auto-reading for ~%s seconds (step %s seconds).",
         total_seconds,
         step_seconds,
     )
 
-    start_time = time.time()
+    # Monotonic deadline pacing: each tick targets start + k*step, so sleep
+    # jitter does not accumulate and wall-clock adjustments cannot skew the
+    # session length.
+    start_time = time.monotonic()
+    deadline = start_time + total_seconds
+    next_tick = start_time
+    inv_total = 1.0 / total_seconds
     bar_width = 30
-    current_page = _get_current_page(driver)
+    current_page = _sync_reading_overlay(driver)
 
     if callable(on_progress):
         try:
@@ -114,66 +180,101 @@ def auto_read_with_progress(
         except Exception:
             pass
 
-    _ensure_reading_overlay(driver)
-    try:
-        page_text = _extract_page_text(driver)
-    except Exception:
-        page_text = ""
-    _update_reading_overlay(driver, current_page, page_text)
-    if callable(on_page_excerpt):
-        try:
-            on_page_excerpt(current_page, page_text)
-        except Exception:
-            pass
+    # OCR runs on a single background worker so the read loop keeps ticking
+    # while a page is being transcribed. Screenshots are still captured on
+    # this thread because the WebDriver connection must not be shared across
+    # threads.
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="page-ocr")
 
+    def _submit_page_ocr():
+        img_np = _capture_page_array(driver)
+        if img_np is None:
+            return None
+        return executor.submit(_ocr_page_array, img_np)
+
+    pending_ocr = _submit_page_ocr()
+    pending_page = current_page
     last_page = current_page
 
-    for _ in range(steps):
-        if callable(stop_requested) and stop_requested():
-            logging.info("Stop requested for auto-reading; exiting early.")
-            break
+    _start_auto_scroll(driver, total_seconds, step_seconds)
+
+    # Render the console bar from a background thread at 1Hz so the
+    # automation loop never blocks on terminal I/O, even with a sub-second
+    # step_seconds.
+    progress_state = {"elapsed": 0.0}
+    progress_stop = threading.Event()
+
+    def _render_progress() -> None:
+        while True:
+            elapsed_now = progress_state["elapsed"]
+            fraction = min(1.0, elapsed_now / total_seconds)
+            filled_now = int(bar_width * fraction)
+            bar_now = "#" * filled_now + "-" * (bar_width - filled_now)
+            print(
+                f"\rReading progress: [{bar_now}] {int(elapsed_now)}/{total_seconds} sec",
+                end="",
+                flush=True,
+            )
+            if progress_stop.wait(1.0):
+                return
 
-        # Wait for the next step interval while the user may manually change pages.
-        time.sleep(step_seconds)
-
-        elapsed = time.time() - start_time
-        progress = min(1.0, elapsed / total_seconds) if total_seconds > 0 else 1.0
-        filled = int(bar_width * progress)
-        bar = "#" * filled + "-" * (bar_width - filled)
-        print(
-            f"\rReading progress: [{bar}] {int(elapsed)}/{total_seconds} sec",
-            end="",
-            flush=True,
-        )
+    progress_thread = threading.Thread(target=_render_progress, daemon=True)
+    progress_thread.start()
 
-        if callable(on_progress):
-            try:
-                on_progress(progress, elapsed, total_seconds)
-            except Exception:
-                pass
+    try:
+        while time.monotonic() < deadline:
+            if callable(stop_requested) and stop_requested():
+                logging.info("Stop requested for auto-reading; exiting early.")
+                break
 
-        # If the user manually changed pages, refresh OCR for the new page.
-        try:
-            page_now = _get_current_page(driver)
-        except Exception:
-            page_now = last_page
+            # Wait for the next step interval while the user may manually change pages.
+            next_tick += step_seconds
+            time.sleep(max(0.0, next_tick - time.monotonic()))
 
-        if page_now != last_page:
-            last_page = page_now
-            try:
-                page_text = _extract_page_text(driver)
-            except Exception:
-                page_text = ""
-            _update_reading_overlay(driver, page_now, page_text)
-            if callable(on_page_excerpt):
+            elapsed = time.monotonic() - start_time
+            progress = min(1.0, elapsed * inv_total)
+            progress_state["elapsed"] = elapsed
+
+            if callable(on_progress):
                 try:
-                    on_page_excerpt(page_now, page_text)
+                    on_progress(progress, elapsed, total_seconds)
                 except Exception:
                     pass
 
-        remaining = total_seconds - elapsed
-        if remaining <= 0:
-            break
+            # Publish completed OCR results without blocking the loop. The
+            # overlay update rides along with the page-number read below so
+            # each tick costs a single driver round-trip.
+            overlay_message = None
+            if pending_ocr is not None and pending_ocr.done():
+                try:
+                    page_text = pending_ocr.result()
+                except Exception:
+                    page_text = ""
+                pending_ocr = None
+                overlay_message = _reading_overlay_message(pending_page, page_text)
+                if callable(on_page_excerpt):
+                    try:
+                        on_page_excerpt(pending_page, page_text)
+                    except Exception:
+                        pass
+
+            # If the user manually changed pages, supersede any in-flight OCR
+            # with the newly visible page.
+            page_now = _sync_reading_overlay(driver, overlay_message)
+
+            if page_now != last_page:
+                last_page = page_now
+                if pending_ocr is not None:
+                    pending_ocr.cancel()
+                pending_page = page_now
+                pending_ocr = _submit_page_ocr()
+    finally:
+        progress_stop.set()
+        progress_thread.join(timeout=2.0)
+        _stop_auto_scroll(driver)
+        if pending_ocr is not None:
+            pending_ocr.cancel()
+        executor.shutdown(wait=False)
 
     print()
     logging.info("Auto-reading completed.")
@@ -182,7 +283,11 @@ def auto_read_with_progress(
 def _get_current_page(driver: WebDriver) -> int:
     """Return the current page number from the SLZ reader controls, defaulting to 1."""
     script = """
-    var input = document.querySelector('app-page-navigation-controls input#pageInput');
+    var input = window.__slzPageInput;
+    if (!input || !input.isConnected) {
+        input = document.querySelector('app-page-navigation-controls input#pageInput');
+        window.__slzPageInput = input;
+    }
     if (input && input.value) {
         var n = parseInt(input.value, 10);
         if (!isNaN(n)) { return n; }
@@ -196,87 +301,382 @@ def _get_current_page(driver: WebDriver) -> int:
         return 1
 
 
-def _ensure_reading_overlay(driver: WebDriver) -> None:
-    script = """
-    (function() {
-        var el = document.getElementById('slz-reading-overlay');
-        if (!el) {
-            el = document.createElement('div');
-            el.id = 'slz-reading-overlay';
-            el.style.position = 'fixed';
-            el.style.left = '16px';
-            el.style.bottom = '16px';
-            el.style.zIndex = '999998';
-            el.style.background = 'rgba(0, 0, 0, 0.8)';
-            el.style.color = '#ffffff';
-            el.style.padding = '8px 12px';
-            el.style.borderRadius = '4px';
-            el.style.fontSize = '11px';
-            el.style.maxWidth = '360px';
-            el.style.maxHeight = '40%';
-            el.style.overflowY = 'auto';
-            el.style.fontFamily = 'system-ui, -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif';
-            el.style.boxShadow = '0 2px 8px rgba(0, 0, 0, 0.4)';
-            document.body.appendChild(el);
+# All in-page helpers are installed once as window.__slz.* functions, so the
+# hot-path calls ship ~40-byte invocation strings to chromedriver instead of
+# re-sending (and re-parsing) the full source on every call. Navigation wipes
+# window, so callers go through _call_slz_helper which reinstalls on demand.
+_SLZ_HELPERS_SCRIPT = """
+    window.__slz = {
+        // Per-tick helper: ensure the reading overlay exists, optionally set
+        // its message, hook page-change events once, and return the current
+        // page number — all in one round-trip.
+        tick: function(msg) {
+            // Cached like __slzPageInput: the DOM lookup runs only when the
+            // overlay has never been created or an SPA re-render detached it.
+            var el = window.__slzReadingOverlay;
+            if (!el || !el.isConnected) {
+                el = document.getElementById('slz-reading-overlay');
+            }
+            if (!el) {
+                el = document.createElement('div');
+                el.id = 'slz-reading-overlay';
+                el.style.position = 'fixed';
+                el.style.left = '16px';
+                el.style.bottom = '16px';
+                el.style.zIndex = '999998';
+                el.style.background = 'rgba(0, 0, 0, 0.8)';
+                el.style.color = '#ffffff';
+                el.style.padding = '8px 12px';
+                el.style.borderRadius = '4px';
+                el.style.fontSize = '11px';
+                el.style.maxWidth = '360px';
+                el.style.maxHeight = '40%';
+                el.style.overflowY = 'auto';
+                el.style.fontFamily = 'system-ui, -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif';
+                el.style.boxShadow = '0 2px 8px rgba(0, 0, 0, 0.4)';
+                document.body.appendChild(el);
+            }
+            window.__slzReadingOverlay = el;
+            if (msg !== null && msg !== undefined) {
+                el.textContent = msg;
+            }
+            // The page input is resolved once and cached; isConnected guards
+            // against SPA re-renders detaching the cached node.
+            var input = window.__slzPageInput;
+            if (!input || !input.isConnected) {
+                input = document.querySelector('app-page-navigation-controls input#pageInput');
+                window.__slzPageInput = input;
+            }
+            if (input && !input.__slzPageHooked) {
+                // Record page changes as they happen so a change between
+                // ticks is never missed. The reader updates the input's value
+                // property, so listen for input/change events and also
+                // observe the value attribute for good measure.
+                input.__slzPageHooked = true;
+                window.__slzPageEvents = window.__slzPageEvents || [];
+                var push = function() {
+                    var n = parseInt(input.value, 10);
+                    if (!isNaN(n)) { window.__slzPageEvents.push(n); }
+                };
+                input.addEventListener('input', push);
+                input.addEventListener('change', push);
+                try {
+                    // Angular updates the value property, not the attribute,
+                    // so also observe the whole controls subtree: any
+                    // re-render there accompanies a page change.
+                    var controls =
+                        document.querySelector('app-page-navigation-controls') || input;
+                    new MutationObserver(push).observe(controls, {
+                        attributes: true,
+                        subtree: true,
+                        characterData: true,
+                        childList: true
+                    });
+                } catch (e) {}
+            }
+            var events = window.__slzPageEvents || [];
+            window.__slzPageEvents = [];
+            if (events.length) { return events[events.length - 1]; }
+            if (input && input.value) {
+                var n = parseInt(input.value, 10);
+                if (!isNaN(n)) { return n; }
+            }
+            return 1;
+        },
+        // Quiz helper overlay: create on first use, set the message when one
+        // is given.
+        overlay: function(msg) {
+            var el = window.__slzHelperOverlay;
+            if (!el || !el.isConnected) {
+                el = document.getElementById('slz-helper-overlay');
+            }
+            if (!el) {
+                el = document.createElement('div');
+                el.id = 'slz-helper-overlay';
+                el.style.position = 'fixed';
+                el.style.right = '16px';
+                el.style.bottom = '16px';
+                el.style.zIndex = '999999';
+                el.style.background = 'rgba(0, 0, 0, 0.85)';
+                el.style.color = '#ffffff';
+                el.style.padding = '8px 12px';
+                el.style.borderRadius = '4px';
+                el.style.fontSize = '12px';
+                el.style.maxWidth = '320px';
+                el.style.fontFamily = 'system-ui, -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif';
+                el.style.boxShadow = '0 2px 8px rgba(0, 0, 0, 0.4)';
+                document.body.appendChild(el);
+            }
+            window.__slzHelperOverlay = el;
+            if (msg !== null && msg !== undefined) {
+                el.textContent = msg;
+            }
+        },
+        // Scrape the visible quiz question and its answer options.
+        // textContent avoids the forced style/layout pass innerText pays;
+        // collapsed whitespace gives the same clean single-line text.
+        extractQuiz: function() {
+            function getText(el) {
+                return el && el.textContent
+                    ? el.textContent.replace(/\\s+/g, ' ').trim()
+                    : '';
+            }
+            var questionEl =
+                document.querySelector('.question-text, .quiz-question, .question') ||
+                document.querySelector('h1, h2, h3, .prompt');
+            var question = getText(questionEl);
+            var optionNodes = Array.from(
+                document.querySelectorAll(
+                    '.answer-option, .option, li.choice, li.answer, button.choice, button.answer'
+                )
+            );
+            var options = optionNodes
+                .map(function(n) { return getText(n); })
+                .filter(function(t) { return t.length > 0; });
+            return { question: question, options: options };
+        },
+        // requestAnimationFrame-driven scroll animation; one install call
+        // instead of a round-trip per scroll step, frame-accurate steps. On
+        // the paginated reader view scrollBy is a harmless no-op.
+        autoScroll: function(totalMs, stepMs) {
+            if (window.__slzAutoScrollStop) { window.__slzAutoScrollStop(); }
+            var stopped = false;
+            window.__slzAutoScrollStop = function() { stopped = true; };
+            var start = performance.now();
+            var last = start;
+            function tick(now) {
+                if (stopped || now - start >= totalMs) { return; }
+                if (now - last >= stepMs) {
+                    last = now;
+                    try { window.scrollBy(0, Math.round(window.innerHeight * 0.8)); } catch (e) {}
+                }
+                requestAnimationFrame(tick);
+            }
+            requestAnimationFrame(tick);
+        },
+        stopAutoScroll: function() {
+            if (window.__slzAutoScrollStop) { window.__slzAutoScrollStop(); }
         }
-    })();
+    };
+"""
+
+
+def _install_slz_helpers(driver: WebDriver) -> None:
+    """Install the window.__slz helper bundle into the current page."""
+    driver.execute_script(_SLZ_HELPERS_SCRIPT)
+
+
+def _call_slz_helper(driver: WebDriver, script: str, *args):
+    """Invoke a pre-installed __slz helper, reinstalling the bundle if the
+    page navigated since it was last installed."""
+    try:
+        return driver.execute_script(script, *args)
+    except WebDriverException:
+        _install_slz_helpers(driver)
+        return driver.execute_script(script, *args)
+
+
+def _start_auto_scroll(driver: WebDriver, total_seconds: float, step_seconds: float) -> None:
+    """Start the in-page scroll animation for the reading session."""
+    try:
+        _call_slz_helper(
+            driver,
+            "window.__slz.autoScroll(arguments[0], arguments[1]);",
+            int(total_seconds * 1000),
+            int(step_seconds * 1000),
+        )
+    except Exception as exc:  # noqa: BLE001
+        logging.warning("Failed to start in-page auto-scroll: %s", exc)
+
+
+def _stop_auto_scroll(driver: WebDriver) -> None:
+    try:
+        _call_slz_helper(driver, "window.__slz.stopAutoScroll();")
+    except Exception:  # noqa: BLE001
+        pass
+
+
+def _reading_overlay_message(page_number: int, excerpt: str) -> str:
+    return f"Page {page_number} excerpt:\n" + (excerpt or "(no text detected)")
+
+
+# Whether CDP Runtime.evaluate is usable for the hot-path tick; cleared on
+# the first failure so non-Chromium drivers fall back to execute_script.
+_CDP_EVAL_OK = True
+
+
+def _cdp_tick(driver: WebDriver, message: str | None):
+    """Run the per-tick helper over CDP Runtime.evaluate.
+
+    This bypasses the W3C execute_script wrapper (script re-injection and
+    argument marshalling through chromedriver), which saves several
+    milliseconds on every tick of the read loop.
     """
-    driver.execute_script(script)
+    expression = f"window.__slz.tick({json.dumps(message)})"
+    result = driver.execute_cdp_cmd(
+        "Runtime.evaluate",
+        {"expression": expression, "returnByValue": True},
+    )
+    if "exceptionDetails" in result:
+        # Most likely the page navigated and the helper bundle is gone.
+        _install_slz_helpers(driver)
+        result = driver.execute_cdp_cmd(
+            "Runtime.evaluate",
+            {"expression": expression, "returnByValue": True},
+        )
+        if "exceptionDetails" in result:
+            raise WebDriverException(str(result["exceptionDetails"]))
+    return result.get("result", {}).get("value")
+
+
+def _sync_reading_overlay(driver: WebDriver, message: str | None = None) -> int:
+    """Ensure the reading overlay exists, optionally set its text, and return
+    the current page number — all in a single driver round-trip."""
+    global _CDP_EVAL_OK
+    if _CDP_EVAL_OK:
+        try:
+            value = _cdp_tick(driver, message)
+            return int(value) if value else 1
+        except WebDriverException:
+            _CDP_EVAL_OK = False
+            logging.info("CDP Runtime.evaluate unavailable; using execute_script.")
+        except Exception:
+            return 1
+    try:
+        value = _call_slz_helper(driver, "return window.__slz.tick(arguments[0]);", message)
+        return int(value) if value else 1
+    except Exception:
+        return 1
 
 
 def _update_reading_overlay(driver: WebDriver, page_number: int, excerpt: str) -> None:
-    message = f"Page {page_number} excerpt:\n" + (excerpt or "(no text detected)")
-    script = """
-    (function(msg) {
-        var el = document.getElementById('slz-reading-overlay');
-        if (!el) { return; }
-        el.textContent = msg;
-    })(arguments[0]);
-    """
-    driver.execute_script(script, message)
+    _sync_reading_overlay(driver, _reading_overlay_message(page_number, excerpt))
 
 
 _EASYOCR_READER = None
+_EASYOCR_READER_LOCK = threading.Lock()
+_OCR_GPU = False
+
+
+def set_ocr_gpu(enabled: bool) -> None:
+    """Select GPU OCR (app_config.automation.ocr_gpu). Call before first OCR use."""
+    global _OCR_GPU
+    _OCR_GPU = bool(enabled)
 
 
 def _get_ocr_reader():
     global _EASYOCR_READER
     if _EASYOCR_READER is None:
-        try:
-            _EASYOCR_READER = easyocr.Reader(["en"], gpu=False)
-        except Exception as exc:  # noqa: BLE001
-            logging.warning("Failed to initialize easyocr Reader: %s", exc)
-            _EASYOCR_READER = None
+        # Warm-up threads and the first real OCR call may race here; the lock
+        # makes sure they share a single (expensive-to-load) Reader.
+        with _EASYOCR_READER_LOCK:
+            if _EASYOCR_READER is None:
+                try:
+                    # cudnn_benchmark lets cuDNN pick the fastest conv
+                    # algorithms for the recurring input shapes (no-op on CPU).
+                    _EASYOCR_READER = easyocr.Reader(
+                        ["en"], gpu=_OCR_GPU, cudnn_benchmark=True
+                    )
+                except Exception as exc:  # noqa: BLE001
+                    logging.warning("Failed to initialize easyocr Reader: %s", exc)
+                    _EASYOCR_READER = None
+                else:
+                    try:
+                        # One tiny inference JIT-compiles/selects the kernels
+                        # up front, so the first real page does not pay for it.
+                        _EASYOCR_READER.readtext(
+                            np.zeros((64, 64, 3), dtype=np.uint8), detail=0
+                        )
+                    except Exception as exc:  # noqa: BLE001
+                        logging.debug("OCR warm-up inference failed: %s", exc)
     return _EASYOCR_READER
 
 
-def _extract_page_text(driver: WebDriver, max_chars: int = 600) -> str:
-    """Extract page text using local OCR (easyocr) on a screenshot.
+# Screenshots wider than this are downscaled before OCR; easyocr's detector
+# works fine at this resolution and the CPU conv stack moves far fewer bytes.
+_OCR_MAX_WIDTH = 1280
 
-    This works even when the book content is rendered as an image in the reader.
+# Whether the CDP screenshot fast path is usable; cleared on first failure so
+# non-Chromium drivers fall back to the W3C endpoint without retrying CDP.
+_CDP_SCREENSHOT_OK = True
+
+
+def _capture_screenshot_bytes(driver: WebDriver) -> bytes:
+    """Grab a screenshot, preferring a CDP JPEG over the W3C PNG endpoint.
+
+    JPEG at quality 60 is roughly an order of magnitude smaller than PNG for
+    text-heavy pages, which cuts both the transfer and the decode time.
     """
+    global _CDP_SCREENSHOT_OK
+    if _CDP_SCREENSHOT_OK:
+        try:
+            result = driver.execute_cdp_cmd(
+                "Page.captureScreenshot",
+                {"format": "jpeg", "quality": 60, "captureBeyondViewport": False},
+            )
+            return base64.b64decode(result["data"])
+        except Exception as exc:  # noqa: BLE001
+            logging.info("CDP screenshot unavailable (%s); using W3C endpoint.", exc)
+            _CDP_SCREENSHOT_OK = False
+    return driver.get_screenshot_as_png()
 
-    reader = _get_ocr_reader()
-    if reader is None:
-        return ""
 
+def _capture_page_array(driver: WebDriver):
+    """Capture a screenshot of the current page as a grayscale numpy array, or None.
+
+    cv2.imdecode goes straight from the compressed bytes to a single-channel
+    array in native code, and the result is downscaled to at most
+    _OCR_MAX_WIDTH, which cuts the OCR stage's memory traffic several-fold on
+    typical laptop screens.
+    """
     try:
-        png_bytes = driver.get_screenshot_as_png()
+        shot_bytes = _capture_screenshot_bytes(driver)
     except Exception as exc:  # noqa: BLE001
         logging.warning("Failed to capture screenshot for OCR: %s", exc)
-        return ""
+        return None
 
     try:
-        image = Image.open(io.BytesIO(png_bytes)).convert("RGB")
+        img_np = cv2.imdecode(np.frombuffer(shot_bytes, np.uint8), cv2.IMREAD_GRAYSCALE)
     except Exception as exc:  # noqa: BLE001
-        logging.warning("Failed to open screenshot image for OCR: %s", exc)
+        logging.warning("Failed to decode screenshot for OCR: %s", exc)
+        return None
+
+    if img_np is None:
+        logging.warning("Failed to decode screenshot for OCR.")
+        return None
+
+    if img_np.shape[1] > _OCR_MAX_WIDTH:
+        new_height = int(img_np.shape[0] * _OCR_MAX_WIDTH / img_np.shape[1])
+        img_np = cv2.resize(
+            img_np,
+            (_OCR_MAX_WIDTH, new_height),
+            interpolation=cv2.INTER_AREA,
+        )
+
+    return img_np
+
+
+# Recently OCR'd pages keyed by (hash of the downscaled image bytes,
+# max_chars), so flipping back to an already-read page (or re-shooting an
+# unchanged one) costs no inference.
+_OCR_TEXT_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+_OCR_TEXT_CACHE_MAX = 32
+
+
+def _ocr_page_array(img_np, max_chars: int = 600) -> str:
+    """Run OCR over a captured page array and return a trimmed excerpt."""
+    reader = _get_ocr_reader()
+    if reader is None:
         return ""
 
     try:
-        img_np = np.array(image)
-    except Exception as exc:  # noqa: BLE001
-        logging.warning("Failed to convert screenshot image to numpy array: %s", exc)
-        return ""
+        cache_key = (hashlib.blake2b(img_np.tobytes(), digest_size=16).digest(), max_chars)
+    except Exception:  # noqa: BLE001
+        cache_key = None
+
+    if cache_key is not None and cache_key in _OCR_TEXT_CACHE:
+        _OCR_TEXT_CACHE.move_to_end(cache_key)
+        return _OCR_TEXT_CACHE[cache_key]
 
     try:
         lines = reader.readtext(img_np, detail=0, paragraph=True) or []
@@ -284,39 +684,121 @@ def _extract_page_text(driver: WebDriver, max_chars: int = 600) -> str:
         logging.warning("easyocr OCR failed: %s", exc)
         return ""
 
-    text = "\n".join(line.strip() for line in lines if isinstance(line, str)).strip()
-    if not text:
-        return ""
+    # Accumulate lines only until the excerpt budget is reached; long pages
+    # can yield hundreds of lines and there is no point joining them all.
+    parts: List[str] = []
+    total = 0
+    truncated = False
+    for line in lines:
+        stripped = line.strip() if isinstance(line, str) else ""
+        if not stripped:
+            continue
+        parts.append(stripped)
+        total += len(stripped) + 1
+        if total >= max_chars:
+            truncated = True
+            break
 
-    if len(text) > max_chars:
+    text = "\n".join(parts)
+    if truncated or len(text) > max_chars:
         text = text[:max_chars] + "\n…"
+
+    if cache_key is not None:
+        _OCR_TEXT_CACHE[cache_key] = text
+        if len(_OCR_TEXT_CACHE) > _OCR_TEXT_CACHE_MAX:
+            _OCR_TEXT_CACHE.popitem(last=False)
+
     return text
 
 
+def _extract_page_text(driver: WebDriver, max_chars: int = 600) -> str:
+    """Extract page text using local OCR (easyocr) on a screenshot.
+
+    This works even when the book content is rendered as an image in the reader.
+    """
+
+    img_np = _capture_page_array(driver)
+    if img_np is None:
+        return ""
+    return _ocr_page_array(img_np, max_chars=max_chars)
+
+
+# WebElements cached across calls; each hit saves a find_element round-trip.
+# Keyed per driver session so parallel book sessions never share elements.
+# Stale references (SPA re-render) and dead sessions are re-resolved
+# transparently.
+_element_cache: dict = {}
+
+
+def _cached_find(driver: WebDriver, key: str, selector: str):
+    cache_key = (driver.session_id, key)
+    element = _element_cache.get(cache_key)
+    if element is not None:
+        try:
+            element.is_enabled()
+            return element
+        except WebDriverException:
+            pass
+    element = driver.find_element(By.CSS_SELECTOR, selector)
+    _element_cache[cache_key] = element
+    return element
+
+
 def _click_next_page(driver: WebDriver) -> bool:
-    """Click the next-page button in the SLZ reader, if available and enabled."""
+    """Click the next-page button in the SLZ reader, if available and enabled.
+
+    Uses short-poll explicit waits: the click happens as soon as the Angular
+    controls render the button clickable, and the function returns as soon as
+    the page number actually changes.
+    """
+    current_page = _get_current_page(driver)
+
+    # Fast path: the cached element is usually still attached and enabled.
+    next_button = None
     try:
-        next_button = driver.find_element(
-            By.CSS_SELECTOR,
+        candidate = _cached_find(
+            driver,
+            "next-page-button",
             "app-page-navigation-controls .next-button button",
         )
-    except NoSuchElementException:
-        logging.warning("Next page button not found in the reader controls.")
-        return False
-
-    classes = next_button.get_attribute("class") or ""
-    if "disabled" in classes or not next_button.is_enabled():
-        logging.info("Next page button appears disabled; likely last page.")
-        return False
+        classes = candidate.get_attribute("class") or ""
+        if "disabled" not in classes and candidate.is_enabled():
+            next_button = candidate
+    except WebDriverException:
+        pass
+
+    if next_button is None:
+        # The controls re-render after a page change; wait for the button to
+        # become clickable instead of failing immediately.
+        try:
+            next_button = WebDriverWait(driver, 3, poll_frequency=0.1).until(
+                EC.element_to_be_clickable(
+                    (
+                        By.CSS_SELECTOR,
+                        "app-page-navigation-controls .next-button button:not(.disabled)",
+                    )
+                )
+            )
+        except TimeoutException:
+            logging.info("Next page button not clickable; likely last page.")
+            return False
 
     try:
         next_button.click()
-        logging.info("Moved to next page in reader.")
-        return True
     except Exception as exc:
         logging.warning("Failed to click next page button: %s", exc)
         return False
 
+    try:
+        WebDriverWait(driver, 5, poll_frequency=0.1).until(
+            lambda d: _get_current_page(d) != current_page
+        )
+    except TimeoutException:
+        logging.warning("Page number did not change after clicking next page.")
+
+    logging.info("Moved to next page in reader.")
+    return True
+
 
 def refresh_reading_transcript(
     driver: WebDriver,
@@ -327,82 +809,27 @@ def refresh_reading_transcript(
 
     Returns a tuple of (page_number, excerpt_text).
     """
-    _ensure_reading_overlay(driver)
-    current_page = _get_current_page(driver)
-    try:
-        page_text = _extract_page_text(driver, max_chars=max_chars)
-    except Exception:
-        page_text = ""
+    # Overlay creation and the page read share one round-trip; the text
+    # update rides on a second after OCR completes.
+    current_page = _sync_reading_overlay(driver)
+    # _extract_page_text already degrades to "" on capture/OCR failure, so a
+    # blanket try/except here would only hide real bugs.
+    page_text = _extract_page_text(driver, max_chars=max_chars)
     _update_reading_overlay(driver, current_page, page_text)
     logging.info("Reading transcript updated for page %s.", current_page)
     return current_page, page_text
 
 
 def _ensure_overlay(driver: WebDriver) -> None:
-    script = """
-    (function() {
-        var el = document.getElementById('slz-helper-overlay');
-        if (!el) {
-            el = document.createElement('div');
-            el.id = 'slz-helper-overlay';
-            el.style.position = 'fixed';
-            el.style.right = '16px';
-            el.style.bottom = '16px';
-            el.style.zIndex = '999999';
-            el.style.background = 'rgba(0, 0, 0, 0.85)';
-            el.style.color = '#ffffff';
-            el.style.padding = '8px 12px';
-            el.style.borderRadius = '4px';
-            el.style.fontSize = '12px';
-            el.style.maxWidth = '320px';
-            el.style.fontFamily = 'system-ui, -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif';
-            el.style.boxShadow = '0 2px 8px rgba(0, 0, 0, 0.4)';
-            document.body.appendChild(el);
-        }
-    })();
-    """
-    driver.execute_script(script)
+    _call_slz_helper(driver, "window.__slz.overlay(arguments[0]);", None)
 
 
 def _update_overlay(driver: WebDriver, message: str) -> None:
-    script = """
-    (function(msg) {
-        var el = document.getElementById('slz-helper-overlay');
-        if (!el) { return; }
-        el.textContent = msg;
-    })(arguments[0]);
-    """
-    driver.execute_script(script, message)
+    _call_slz_helper(driver, "window.__slz.overlay(arguments[0]);", message)
 
 
 def _extract_quiz_question_and_options(driver: WebDriver) -> Tuple[str, List[str]]:
-    script = """
-    return (function() {
-        function getText(el) {
-            return el && el.innerText ? el.innerText.trim() : '';
-        }
-
-        var questionEl =
-            document.querySelector('.question-text, .quiz-question, .question') ||
-            document.querySelector('h1, h2, h3, .prompt');
-
-        var question = getText(questionEl);
-
-        var optionNodes = Array.from(
-            document.querySelectorAll(
-                '.answer-option, .option, li.choice, li.answer, button.choice, button.answer'
-            )
-        );
-
-        var options = optionNodes
-            .map(function(n) { return getText(n); })
-            .filter(function(t) { return t.length > 0; });
-
-        return { question: question, options: options };
-    })();
-    """
-
-    data = driver.execute_script(script) or {}
+    data = _call_slz_helper(driver, "return window.__slz.extractQuiz();") or {}
     question = data.get("question") or ""
     options = data.get("options") or []
     return question, options
@@ -448,18 +875,22 @@ def run_quiz_assistant(
 
         logging.info("Question %s text: %.80s", index, question.replace("\n", " "))
 
-        if trimmed_context:
-            augmented_question = (
-                "Use the following book transcript to answer the quiz question.\n\n"
-                f"Book transcript:\n{trimmed_context}\n\n"
-                f"Quiz question:\n{question}"
-            )
-        else:
-            augmented_question = question
-
+        # Stream the answer and surface partial text in the overlay, so the
+        # user sees the suggestion forming after the first tokens instead of
+        # waiting for the full completion. Overlay updates are debounced to
+        # roughly 10/s to keep WebDriver round-trips off the streaming path.
+        _update_overlay(driver, f"Q{index}: Thinking…")
         try:
-            suggestion = llm_client.choose_answer(augmented_question, options)
-        except Exception as exc:
+            parts: List[str] = []
+            last_overlay_update = 0.0
+            for fragment in llm_client.choose_answer_stream(question, options, trimmed_context):
+                parts.append(fragment)
+                now = time.monotonic()
+                if now - last_overlay_update >= 0.1:
+                    last_overlay_update = now
+                    _update_overlay(driver, f"Q{index}: {''.join(parts)}")
+            suggestion = "".join(parts).strip()
+        except Exception as exc:  # noqa: BLE001
             logging.error("LLM call failed for question %s: %s", index, exc)
             break
 
@@ -473,9 +904,40 @@ def run_quiz_assistant(
             except Exception:
                 pass
 
+        # While we block on input() the driver sits idle and the page usually
+        # advances to the next question. Watch for it in the background and
+        # warm the LLM response cache, so the next suggestion is instant.
+        stop_prefetch = threading.Event()
+
+        def _prefetch_next(current_question: str = question) -> None:
+            try:
+                while not stop_prefetch.is_set():
+                    next_question, next_options = _extract_quiz_question_and_options(driver)
+                    if (
+                        next_question
+                        and next_question != current_question
+                        and len(next_options) >= 2
+                    ):
+                        llm_client.choose_answer(
+                            next_question, next_options, context=trimmed_context
+                        )
+                        return
+                    if stop_prefetch.wait(0.5):
+                        return
+            except Exception:  # noqa: BLE001
+                pass
+
+        prefetch_thread = threading.Thread(target=_prefetch_next, daemon=True)
+        prefetch_thread.start()
+
         user_input = input(
             "Press Enter to proceed to the next quiz question, or type 'q' to stop: "
         ).strip().lower()
+        stop_prefetch.set()
+        # Give an in-flight DOM extraction a moment to finish so the driver is
+        # not used from two threads; a pending LLM call may keep running as it
+        # only touches the response cache.
+        prefetch_thread.join(timeout=2.0)
         if user_input == "q":
             logging.info("Quiz assistant stopped by user after question %s.", index)
             break
@@ -1,46 +1,100 @@
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 
-from config.settings import load_config
+from config.settings import AppConfig, load_config
 from automation.browser import create_driver
-from automation.workflows import auto_read_with_progress, login, run_quiz_assistant
+from automation.workflows import (
+    auto_read_with_progress,
+    login,
+    run_quiz_assistant,
+    set_ocr_gpu,
+    _get_ocr_reader,
+)
 from ai.remote_client import RemoteLLMClient
 
 
-def main() -> None:
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(message)s",
-    )
+def run_book_session(
+    config: AppConfig,
+    session_index: int = 1,
+    input_lock: threading.Lock | None = None,
+) -> None:
+    """Run the login/read/quiz flow for one book in its own browser session.
 
-    config = load_config()
-    logging.info("Configuration loaded successfully.")
+    When several sessions run concurrently, input_lock serializes the
+    interactive console prompts so they do not interleave. Each session gets
+    its own Chrome profile (the driver backends create per-session
+    user-data-dirs), so profiles never clash.
+    """
+    prompt_guard = input_lock if input_lock is not None else nullcontext()
 
     driver = create_driver(config.automation, driver_mode=None)
-    logging.info("Chrome WebDriver initialized.")
+    logging.info("Chrome WebDriver initialized (session %s).", session_index)
+
+    # Build the LLM client up front and warm its connection pool while the
+    # user is busy logging in and navigating; the first quiz question then
+    # skips client setup and the TLS handshake.
+    llm_client = RemoteLLMClient(config.llm)
+    threading.Thread(target=llm_client.warm_up, daemon=True).start()
 
     try:
-        login(driver, config)
-        logging.info("Login phase completed.")
+        with prompt_guard:
+            login(driver, config)
+        logging.info("Login phase completed (session %s).", session_index)
 
-        logging.info(
-            "In the browser, navigate to the book you want to read and open the reading view. "
-            "Then return to this console and press Enter to start auto-reading."
-        )
-        input("When the book reading view is open, press Enter here to start auto-reading...")
+        with prompt_guard:
+            logging.info(
+                "In the browser, navigate to the book you want to read and open the reading view. "
+                "Then return to this console and press Enter to start auto-reading."
+            )
+            input("When the book reading view is open, press Enter here to start auto-reading...")
 
         auto_read_with_progress(driver, config)
 
-        logging.info(
-            "If a quiz is available for this book, navigate to the first quiz question in the "
-            "browser, then return here and press Enter to start the quiz assistant."
-        )
-        input("When you are on the first quiz question, press Enter here to continue...")
+        with prompt_guard:
+            logging.info(
+                "If a quiz is available for this book, navigate to the first quiz question in the "
+                "browser, then return here and press Enter to start the quiz assistant."
+            )
+            input("When you are on the first quiz question, press Enter here to continue...")
 
-        llm_client = RemoteLLMClient(config.llm)
         run_quiz_assistant(driver, config, llm_client)
     finally:
         driver.quit()
-        logging.info("Browser closed.")
+        logging.info("Browser closed (session %s).", session_index)
+
+
+def main() -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+    )
+
+    config = load_config()
+    logging.info("Configuration loaded successfully.")
+    set_ocr_gpu(config.automation.ocr_gpu)
+
+    # Loading the OCR model takes several seconds; start it now so it is
+    # resident by the time the user has logged in and opened a book.
+    threading.Thread(target=_get_ocr_reader, daemon=True).start()
+
+    parallel = config.automation.max_parallel_books
+    if parallel <= 1:
+        run_book_session(config)
+        return
+
+    # Drive several books at once, one Chrome session per book. Console
+    # prompts are serialized via the shared lock.
+    logging.info("Starting %s parallel book sessions.", parallel)
+    input_lock = threading.Lock()
+    with ThreadPoolExecutor(max_workers=parallel) as executor:
+        futures = [
+            executor.submit(run_book_session, config, index + 1, input_lock)
+            for index in range(parallel)
+        ]
+        for future in futures:
+            future.result()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,109 @@
+"""OS clipboard-change notifications for the easy-screenshot watchers.
+
+On Windows a daemon thread owns a message-only window registered with
+AddClipboardFormatListener, so a paste raises WM_CLIPBOARDUPDATE instead of
+the app polling the clipboard every few hundred milliseconds. There is no
+comparable dependency-free story on X11/Wayland, so on other platforms
+start() reports failure and callers keep their polling loop.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+from typing import Callable
+
+_WM_CLIPBOARDUPDATE = 0x031D
+_WM_QUIT = 0x0012
+_HWND_MESSAGE = -3
+
+
+class ClipboardListener:
+    """Invoke a callback whenever the OS clipboard contents change.
+
+    The callback runs on the listener's own daemon thread; marshal any UI
+    work back with root.after. start() returns True only when event-driven
+    notifications are actually available.
+    """
+
+    def __init__(self, callback: Callable[[], None]) -> None:
+        self._callback = callback
+        self._thread: threading.Thread | None = None
+        self._thread_id: int | None = None
+        self._ready = threading.Event()
+        self._ok = False
+
+    def start(self) -> bool:
+        if not sys.platform.startswith("win"):
+            return False
+        if self._thread is not None:
+            return self._ok
+        self._thread = threading.Thread(
+            target=self._run,
+            name="clipboard-listener",
+            daemon=True,
+        )
+        self._thread.start()
+        self._ready.wait(timeout=2.0)
+        return self._ok
+
+    def stop(self) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+        self._thread = None
+        if self._thread_id is not None:
+            import ctypes
+
+            ctypes.windll.user32.PostThreadMessageW(self._thread_id, _WM_QUIT, 0, 0)
+        thread.join(timeout=2.0)
+
+    def _run(self) -> None:
+        import ctypes
+        from ctypes import wintypes
+
+        user32 = ctypes.windll.user32
+        kernel32 = ctypes.windll.kernel32
+
+        # A message-only window of the stock STATIC class is enough:
+        # WM_CLIPBOARDUPDATE is posted, so the message loop sees it without
+        # needing a custom window procedure.
+        hwnd = user32.CreateWindowExW(
+            0,
+            "STATIC",
+            "slz-clipboard-listener",
+            0,
+            0,
+            0,
+            0,
+            0,
+            _HWND_MESSAGE,
+            None,
+            None,
+            None,
+        )
+        if not hwnd or not user32.AddClipboardFormatListener(hwnd):
+            if hwnd:
+                user32.DestroyWindow(hwnd)
+            logging.debug("Clipboard listener unavailable; falling back to polling.")
+            self._ready.set()
+            return
+
+        self._thread_id = kernel32.GetCurrentThreadId()
+        self._ok = True
+        self._ready.set()
+
+        msg = wintypes.MSG()
+        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            if msg.message == _WM_CLIPBOARDUPDATE:
+                try:
+                    self._callback()
+                except Exception:  # noqa: BLE001
+                    logging.exception("Clipboard listener callback failed")
+            else:
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+
+        user32.RemoveClipboardFormatListener(hwnd)
+        user32.DestroyWindow(hwnd)
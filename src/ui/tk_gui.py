@@ -1,10 +1,16 @@
+from __future__ import annotations
+
+import hashlib
+import io
 import logging
 import threading
 import re
+from concurrent.futures import ThreadPoolExecutor
 import os
+import subprocess
+import sys
 import time
-import hashlib
-from collections import deque
+from collections import OrderedDict, deque
 import traceback
 from tkinter import (
     BOTH,
@@ -15,7 +21,6 @@ from tkinter import (
     LEFT,
     RIGHT,
     Y,
-    Button,
     Checkbutton,
     Frame,
     Label,
@@ -28,24 +33,81 @@ from tkinter import (
 )
 from tkinter import ttk
 
+from typing import TYPE_CHECKING
+
 import numpy as np
+import PIL
 from PIL import Image, ImageGrab, ImageTk
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
-
-from automation.browser import create_driver
-from automation.workflows import (
-    fill_login_form,
-    _get_ocr_reader,
-)
-from ai.remote_client import RemoteLLMClient
+
 from config.settings import AppConfig, load_config
+from ui.clipboard_events import ClipboardListener
+
+# selenium, the automation modules and the LLM client together cost hundreds
+# of milliseconds to import; they are pulled in lazily by the handlers that
+# need them so the window appears immediately on launch. numpy and PIL stay
+# top-level: the paste/preview machinery needs them from the first click.
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+
+# Quiz-text parsing patterns, compiled once; _parse_quiz_text and on_quiz run
+# them over every OCR line / suggestion.
+_OPTION_RE = re.compile(r"^([A-Z])[\.\)]\s*(.*)$")
+_OPT_LETTERS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+_QNUM_RE = re.compile(r"^\d+[\).]?\s*(.*)$")
+_LETTER_PUNCT_RE = re.compile(r"\b([A-F])[\).]\b")
+_LETTER_RE = re.compile(r"\b([A-F])\b")
+
+# Sampling grid for the cheap clipboard fingerprint: 64 fixed fractional
+# positions, scaled to the image at probe time.
+_FP_POINTS = tuple((i, j) for i in range(8) for j in range(8))
+
+# Log classification, checked in priority order (error beats quiz beats book
+# beats status). Each alternation searches in C instead of a Python-level
+# any(...) scan per keyword group.
+_LOG_TAG_RES = (
+    (re.compile(r"error:|failed|exception|could not"), "log_error"),
+    (re.compile(r"quiz"), "log_quiz"),
+    (re.compile(r"transcript page|transcription|ocr"), "log_book"),
+    (
+        re.compile(
+            r"^(?:initializing|opening slz|browser is not running"
+            r"|configuration loaded|chrome webdriver initialized)"
+        ),
+        "log_status",
+    ),
+)
+
+
+class _LRUSet:
+    """Bounded seen-ring with O(1) membership.
+
+    The clipboard watchers probe their seen-signatures on every tick; a
+    deque answers `in` with a linear scan of up to maxlen entries, while
+    an OrderedDict keyed by signature answers in constant time and still
+    evicts oldest-first.
+    """
+
+    __slots__ = ("_items", "_maxlen")
+
+    def __init__(self, maxlen: int) -> None:
+        self._items: OrderedDict[int, None] = OrderedDict()
+        self._maxlen = maxlen
+
+    def __contains__(self, sig: int) -> bool:
+        return sig in self._items
+
+    def append(self, sig: int) -> None:
+        self._items[sig] = None
+        self._items.move_to_end(sig)
+        if len(self._items) > self._maxlen:
+            self._items.popitem(last=False)
 
 
 class TkApp:
+    _LOG_MAX_LINES = 5000
+    _THUMB_CELL = 104
+
     def __init__(self, root: Tk) -> None:
         self.root = root
         self.root.title("SLZ Book Reader Controller")
@@ -67,145 +129,187 @@ class TkApp:
         self.driver_mode_var = StringVar(value=self.driver_mode_labels[0])
         self.easy_book_screenshot_var = BooleanVar(value=True)
         self.easy_quiz_screenshot_var = BooleanVar(value=False)
+        self._clipboard_listener: ClipboardListener | None = None
+        self._clipboard_events_active: bool = False
+        # Polling fallback backoff: fast right after activity, easing off to
+        # 2s after a stretch of empty polls and 5s while the window is
+        # unfocused. Event-driven mode ignores these entirely.
+        self._easy_poll_interval_ms: int = 300
+        self._easy_empty_polls: int = 0
+        self._last_clipboard_seq: int = 0
+        self._book_poll_in_flight: bool = False
+        self._quiz_poll_in_flight: bool = False
+        self._last_cheap_fp: tuple | None = None
         self._easy_book_clipboard_job: str | None = None
-        self._easy_book_clipboard_seen: deque[str] = deque(maxlen=200)
-        self._easy_book_clipboard_last_sig: str | None = None
+        self._easy_book_clipboard_seen = _LRUSet(maxlen=200)
+        self._easy_book_clipboard_last_sig: int | None = None
         self._easy_quiz_clipboard_job: str | None = None
-        self._easy_quiz_clipboard_seen: deque[str] = deque(maxlen=200)
-        self._easy_quiz_clipboard_last_sig: str | None = None
+        self._easy_quiz_clipboard_seen = _LRUSet(maxlen=200)
+        self._easy_quiz_clipboard_last_sig: int | None = None
         self._quiz_transcribing: bool = False
         self._pending_quiz_image: Image.Image | None = None
-        self._pending_quiz_sig: str | None = None
+        self._pending_quiz_sig: int | None = None
         self.page_images: list[Image.Image] = []
         self.page_texts: list[str] = []
+        self._book_context_tail: str = ""
         self.quiz_image: Image.Image | None = None
         self.quiz_text: str | None = None
+        # Built lazily on the first quiz click and reused so repeat quizzes
+        # share one HTTP session (keep-alive skips DNS/TCP/TLS setup).
+        self._llm_client = None
         self._last_image_tk: ImageTk.PhotoImage | None = None
+        self._preview_canvas: Image.Image | None = None
         self.thumb_images: list[ImageTk.PhotoImage] = []
+        self._log_queue: deque[tuple[str, str]] = deque()
+        self._log_flush_scheduled: bool = False
+        self._preview_cache: dict[int, Image.Image] = {}
+        self._thumb_pil_cache: dict[int, Image.Image] = {}
+        self._ocr_array_cache: dict[int, np.ndarray] = {}
+        # Content-addressed transcripts: re-running transcription on pages
+        # that have not changed skips the OCR forward pass entirely.
+        self._ocr_text_cache: OrderedDict[bytes, str] = OrderedDict()
+        self._thumb_pool: list[tuple[int, int, int]] = []
+        self._pending_progress: float | None = None
+        self._progress_scheduled: bool = False
+        # One shared pool for every background task; per-click Thread objects
+        # pay creation cost on each click and allow unbounded concurrency.
+        self._bg_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tkbg")
 
         self._setup_logging()
         self._build_ui()
 
+        # Loading the OCR model takes several seconds; do it now in the
+        # background so the first "Transcribe" click does not stall the UI.
+        self._run_in_background(self._warm_ocr_reader)
+
         if self.easy_book_screenshot_var.get():
             self.root.after(0, self.on_toggle_easy_book_screenshot)
 
+        self.root.bind("<FocusOut>", self._on_root_focus_out)
+        self.root.bind("<FocusIn>", self._on_root_focus_in)
+
     def _setup_logging(self) -> None:
         logging.basicConfig(
             level=logging.INFO,
             format="%(asctime)s [%(levelname)s] %(message)s",
         )
+        # Pillow-SIMD publishes versions like "9.0.0.post1"; surface whether
+        # the accelerated resize/convert build is in use (see requirements.txt).
+        pil_version = getattr(PIL, "__version__", "")
+        if "post" in pil_version:
+            logging.info("Pillow-SIMD detected (%s).", pil_version)
+        else:
+            logging.debug("Standard Pillow in use (%s).", pil_version)
 
     def _build_ui(self) -> None:
+        # One named ttk style per color family, instead of four color kwargs
+        # parsed and stored per plain-Tk Button.
+        style = ttk.Style(self.root)
+        try:
+            # The platform default themes ignore background on buttons.
+            style.theme_use("clam")
+        except Exception:  # noqa: BLE001
+            pass
+        for name, bg, fg, active in (
+            ("Blue", "#1976D2", "white", "#1565C0"),
+            ("Green", "#2E7D32", "white", "#1B5E20"),
+            ("LightGreen", "#A5D6A7", "black", "#81C784"),
+            ("Purple", "#6A1B9A", "white", "#4A148C"),
+            ("Orange", "#FF8F00", "black", "#FF6F00"),
+            ("Red", "#C62828", "white", "#B71C1C"),
+            ("Gray", "#E0E0E0", "black", "#BDBDBD"),
+        ):
+            style.configure(f"{name}.TButton", background=bg, foreground=fg)
+            style.map(f"{name}.TButton", background=[("active", active)])
+
         button_frame = Frame(self.root)
         button_frame.pack(fill="x", padx=8, pady=8)
 
-        self.launch_button = Button(
+        self.launch_button = ttk.Button(
             button_frame,
             text="1. Launch SLZ / Login",
             command=self.on_launch,
-            bg="#1976D2",
-            fg="white",
-            activebackground="#1565C0",
-            activeforeground="white",
+            style="Blue.TButton",
         )
         self.launch_button.pack(side=LEFT, padx=4)
 
-        self.fill_login_button = Button(
+        self.fill_login_button = ttk.Button(
             button_frame,
             text="Fill Login Form",
             command=self.on_fill_login,
-            bg="#1976D2",
-            fg="white",
-            activebackground="#1565C0",
-            activeforeground="white",
+            style="Blue.TButton",
         )
         self.fill_login_button.pack(side=LEFT, padx=4)
 
-        self.lexile_button = Button(
+        self.lexile_button = ttk.Button(
             button_frame,
             text="Lexile Levels",
             command=self.on_set_lexile_levels,
-            bg="#1976D2",
-            fg="white",
-            activebackground="#1565C0",
-            activeforeground="white",
+            style="Blue.TButton",
         )
         self.lexile_button.pack(side=LEFT, padx=4)
 
-        self.paste_button = Button(
+        self.paste_button = ttk.Button(
             button_frame,
             text="Paste BOOK Screenshot (Ctrl+B)",
             command=self.on_paste_screenshot,
-            bg="#2E7D32",
-            fg="white",
-            activebackground="#1B5E20",
-            activeforeground="white",
+            style="Green.TButton",
         )
         self.paste_button.pack(side=LEFT, padx=4)
 
-        self.read_button = Button(
+        self.capture_button = ttk.Button(
+            button_frame,
+            text="Capture Screen",
+            command=self.on_capture_screen,
+            style="Green.TButton",
+        )
+        self.capture_button.pack(side=LEFT, padx=4)
+
+        self.read_button = ttk.Button(
             button_frame,
             text="2. Transcribe Book Screenshots (Ctrl+N)",
             command=self.on_read,
-            bg="#2E7D32",
-            fg="white",
-            activebackground="#1B5E20",
-            activeforeground="white",
+            style="Green.TButton",
         )
         self.read_button.pack(side=LEFT, padx=4)
 
-        self.clear_book_button = Button(
+        self.clear_book_button = ttk.Button(
             button_frame,
             text="Clear BOOK Screenshots",
             command=self.on_clear_book_screenshots,
-            bg="#A5D6A7",
-            fg="black",
-            activebackground="#81C784",
-            activeforeground="black",
+            style="LightGreen.TButton",
         )
         self.clear_book_button.pack(side=LEFT, padx=4)
 
-        self.paste_quiz_button = Button(
+        self.paste_quiz_button = ttk.Button(
             button_frame,
             text="Paste QUIZ Screenshot (Ctrl+Q)",
             command=self.on_paste_quiz_screenshot,
-            bg="#6A1B9A",
-            fg="white",
-            activebackground="#4A148C",
-            activeforeground="white",
+            style="Purple.TButton",
         )
         self.paste_quiz_button.pack(side=LEFT, padx=4)
 
-        self.transcribe_quiz_button = Button(
+        self.transcribe_quiz_button = ttk.Button(
             button_frame,
             text="Transcribe Quiz Screenshot (Ctrl+W)",
             command=self.on_transcribe_quiz,
-            bg="#6A1B9A",
-            fg="white",
-            activebackground="#4A148C",
-            activeforeground="white",
+            style="Purple.TButton",
         )
         self.transcribe_quiz_button.pack(side=LEFT, padx=4)
 
-        self.quiz_button = Button(
+        self.quiz_button = ttk.Button(
             button_frame,
             text="3. Answer Quiz from Book",
             command=self.on_quiz,
-            bg="#FF8F00",
-            fg="black",
-            activebackground="#FF6F00",
-            activeforeground="black",
+            style="Orange.TButton",
         )
         self.quiz_button.pack(side=LEFT, padx=4)
 
-        self.exit_button = Button(
+        self.exit_button = ttk.Button(
             button_frame,
             text="Exit",
             command=self.on_exit,
-            bg="#C62828",
-            fg="white",
-            activebackground="#B71C1C",
-            activeforeground="white",
+            style="Red.TButton",
         )
         self.exit_button.pack(side=RIGHT, padx=4)
 
@@ -225,25 +329,19 @@ class TkApp:
         )
         self.driver_mode_combo.pack(side=LEFT, padx=(8, 0))
 
-        self.clear_all_button = Button(
+        self.clear_all_button = ttk.Button(
             driver_frame,
             text="Clear All",
             command=self.on_clear_all,
-            bg="#E0E0E0",
-            fg="black",
-            activebackground="#BDBDBD",
-            activeforeground="black",
+            style="Gray.TButton",
         )
         self.clear_all_button.pack(side=RIGHT)
 
-        self.copy_book_transcript_button = Button(
+        self.copy_book_transcript_button = ttk.Button(
             driver_frame,
             text="Copy Book Transcript",
             command=self.on_copy_book_transcript,
-            bg="#E0E0E0",
-            fg="black",
-            activebackground="#BDBDBD",
-            activeforeground="black",
+            style="Gray.TButton",
         )
         self.copy_book_transcript_button.pack(side=RIGHT, padx=(0, 8))
 
@@ -297,15 +395,6 @@ class TkApp:
         self.thumb_scrollbar.pack(side=BOTTOM, fill=X)
         self.thumb_canvas.configure(xscrollcommand=self.thumb_scrollbar.set)
 
-        self.thumb_frame = Frame(self.thumb_canvas)
-        self._thumb_window = self.thumb_canvas.create_window(
-            (0, 0),
-            window=self.thumb_frame,
-            anchor="nw",
-        )
-
-        self.thumb_frame.bind("<Configure>", self._on_thumb_frame_configure)
-        self.thumb_canvas.bind("<Configure>", self._on_thumb_canvas_configure)
         self.thumb_canvas.bind("<Enter>", self._bind_thumb_scroll)
         self.thumb_canvas.bind("<Leave>", self._unbind_thumb_scroll)
 
@@ -334,12 +423,6 @@ class TkApp:
         self.root.bind_all("<Control-n>", lambda event: self.on_read())
         self.root.bind_all("<Control-w>", lambda event: self.on_transcribe_quiz())
 
-    def _on_thumb_frame_configure(self, event) -> None:
-        self.thumb_canvas.configure(scrollregion=self.thumb_canvas.bbox("all"))
-
-    def _on_thumb_canvas_configure(self, event) -> None:
-        self.thumb_canvas.configure(scrollregion=self.thumb_canvas.bbox("all"))
-
     def _bind_thumb_scroll(self, event) -> None:
         self.thumb_canvas.bind("<MouseWheel>", self._on_thumb_mousewheel)
         self.thumb_canvas.bind("<Button-4>", self._on_thumb_mousewheel)
@@ -362,81 +445,270 @@ class TkApp:
         if delta:
             self.thumb_canvas.xview_scroll(delta, "units")
 
-    def _append_log(self, message: str, tag: str) -> None:
-        self.log_text.configure(state="normal")
-        self.log_text.insert(END, message + "\n", (tag,))
-        self.log_text.see(END)
-        self.log_text.configure(state="disabled")
-        self.status_label.configure(text=message)
-
     def _clear_log_text(self) -> None:
         self.log_text.configure(state="normal")
         self.log_text.delete("1.0", END)
         self.log_text.configure(state="disabled")
 
     def _set_progress(self, fraction: float) -> None:
-        value = max(0.0, min(1.0, fraction)) * 100.0
-
-        def _update() -> None:
+        # Coalesce like the log queue: remember only the newest value and
+        # apply it at most once per ~frame, so rapid OCR progress does not
+        # queue a repaint per page.
+        self._pending_progress = max(0.0, min(1.0, fraction)) * 100.0
+        if not self._progress_scheduled:
+            self._progress_scheduled = True
+            self.root.after(16, self._flush_progress)
+
+    def _flush_progress(self) -> None:
+        self._progress_scheduled = False
+        value = self._pending_progress
+        if value is not None:
+            self._pending_progress = None
             self.progress_var.set(value)
 
-        self.root.after(0, _update)
+    def _preview_for(self, image: Image.Image) -> Image.Image:
+        """Return a cached <=320x240 preview of a pasted screenshot.
+
+        The preview is computed once per image; the thumbnail strip derives
+        its 96x96 thumbs from it, so a multi-megapixel screenshot is
+        downscaled a single time instead of once per consumer and once per
+        strip rebuild. BILINEAR is indistinguishable from LANCZOS at these
+        sizes and noticeably cheaper.
+        """
+        key = id(image)
+        preview = self._preview_cache.get(key)
+        if preview is None:
+            # resize() is non-destructive, so no full-resolution copy() is
+            # staged just to be thumbnailed away.
+            scale = min(320 / image.width, 240 / image.height, 1.0)
+            size = (
+                max(1, int(image.width * scale)),
+                max(1, int(image.height * scale)),
+            )
+            if size == image.size:
+                preview = image
+            elif image.width * image.height > 5_000_000:
+                # Very large pastes: integer-factor box reduction first, so
+                # the resample kernel only ever sees a near-target raster.
+                factor = max(1, min(image.width // 640, image.height // 480))
+                staged = image.reduce(factor) if factor > 1 else image
+                preview = staged.resize(size, Image.BILINEAR)
+            else:
+                # reducing_gap lets a cheap box reduction do most of the
+                # shrink before the resample kernel touches the pixels.
+                preview = image.resize(size, Image.BILINEAR, reducing_gap=3.0)
+            self._preview_cache[key] = preview
+        return preview
+
+    def _ocr_array_for(self, image: Image.Image) -> np.ndarray:
+        """Return a cached OCR-ready array for a pasted screenshot.
+
+        Computed in the background at paste time (while the user lines up the
+        next screenshot), so the Transcribe step skips per-page conversion.
+        With ocr_fast the image is also grayscaled and capped at 1600px; see
+        config.yaml.
+        """
+        key = id(image)
+        arr = self._ocr_array_cache.get(key)
+        if arr is None:
+            if self.config.automation.ocr_fast:
+                if image.mode != "L":
+                    image = image.convert("L")
+                longest = max(image.size)
+                if longest > 1600:
+                    scale = 1600.0 / longest
+                    image = image.resize(
+                        (int(image.width * scale), int(image.height * scale)),
+                        Image.BILINEAR,
+                    )
+            arr = np.ascontiguousarray(np.asarray(image))
+            self._ocr_array_cache[key] = arr
+        return arr
+
+    _OCR_CACHE_MAX = 128
+
+    @staticmethod
+    def _ocr_cache_key(img_np: np.ndarray) -> bytes:
+        # blake2b over the prepared array (already contiguous) is a few ms
+        # against the multi-hundred-ms OCR call it can save.
+        return hashlib.blake2b(img_np, digest_size=16).digest()
+
+    def _ocr_cache_get(self, key: bytes) -> str | None:
+        text = self._ocr_text_cache.get(key)
+        if text is not None:
+            self._ocr_text_cache.move_to_end(key)
+        return text
+
+    def _ocr_cache_put(self, key: bytes, text: str) -> None:
+        self._ocr_text_cache[key] = text
+        if len(self._ocr_text_cache) > self._OCR_CACHE_MAX:
+            self._ocr_text_cache.popitem(last=False)
+
+    @staticmethod
+    def _looks_blank(img_np: np.ndarray) -> bool:
+        """Cheap blank-page check on a 1/64 strided sample.
+
+        A near-uniform frame has ~zero std; spotting it costs well under a
+        millisecond and saves a full detector forward pass in EasyOCR.
+        """
+        return float(img_np[::8, ::8].std()) < 3.0
+
+    def _evict_preview(self, image: Image.Image) -> None:
+        self._preview_cache.pop(id(image), None)
+        self._thumb_pil_cache.pop(id(image), None)
+        self._ocr_array_cache.pop(id(image), None)
+
+    def _set_quiz_image(self, image: Image.Image) -> None:
+        # Unlike book pages, which are evicted when deleted, the quiz
+        # screenshot is replaced in place — drop the old image's id()-keyed
+        # cache entries before releasing it, or they leak and a later image
+        # reusing the freed id() would serve stale hits.
+        old = self.quiz_image
+        if old is not None and old is not image:
+            self._evict_preview(old)
+        self.quiz_image = image
 
     def _show_last_image(self, image: Image.Image) -> None:
-        max_w, max_h = 320, 240
-        w, h = image.size
-        scale = min(max_w / float(w), max_h / float(h), 1.0)
-        if scale < 1.0:
-            display = image.resize((int(w * scale), int(h * scale)), Image.LANCZOS)
+        # One fixed 320x240 PhotoImage is allocated on first use and blitted
+        # into thereafter; recreating it per paste re-uploads a fresh Tk
+        # bitmap every time. The preview is centered on a dark letterbox so
+        # smaller/odd-aspect pages do not leave stale pixels behind.
+        display = self._preview_for(image)
+        if self._preview_canvas is None:
+            self._preview_canvas = Image.new("RGB", (320, 240), (32, 32, 32))
+        canvas = self._preview_canvas
+        canvas.paste((32, 32, 32), (0, 0, canvas.width, canvas.height))
+        canvas.paste(
+            display,
+            ((canvas.width - display.width) // 2, (canvas.height - display.height) // 2),
+        )
+        if self._last_image_tk is None:
+            self._last_image_tk = ImageTk.PhotoImage(canvas)
         else:
-            display = image
-        self._last_image_tk = ImageTk.PhotoImage(display)
+            self._last_image_tk.paste(canvas)
         self.image_label.configure(image=self._last_image_tk, text="")
 
-    def _rebuild_thumbnails(self) -> None:
-        for widget in self.thumb_frame.winfo_children():
-            widget.destroy()
-        self.thumb_images.clear()
-
-        for index, image in enumerate(self.page_images, start=1):
-            thumb = image.copy()
-            thumb.thumbnail((96, 96), Image.LANCZOS)
+    def _thumb_slot(self, index: int) -> tuple[int, int, int]:
+        """Return (creating on first use) the canvas items for slot index.
+
+        Thumbnails are drawn straight onto the canvas at fixed cell
+        positions, so adding one involves no geometry manager and no new
+        widgets; Tk's pack manager would re-lay out every sibling on each
+        paste. Items are created once and reused across rebuilds.
+        """
+        while len(self._thumb_pool) <= index:
+            slot = len(self._thumb_pool)
+            x0 = slot * self._THUMB_CELL
+            image_item = self.thumb_canvas.create_image(
+                x0 + self._THUMB_CELL // 2,
+                4,
+                anchor="n",
+            )
+            delete_tag = f"thumb-delete-{slot}"
+            delete_rect = self.thumb_canvas.create_rectangle(
+                x0 + 4,
+                104,
+                x0 + self._THUMB_CELL - 4,
+                122,
+                fill="#C62828",
+                outline="",
+                tags=(delete_tag,),
+            )
+            delete_text = self.thumb_canvas.create_text(
+                x0 + self._THUMB_CELL // 2,
+                113,
+                text="X",
+                fill="white",
+                tags=(delete_tag,),
+            )
+            self.thumb_canvas.tag_bind(
+                delete_tag,
+                "<Button-1>",
+                lambda _event, idx=slot: self._delete_book_screenshots(idx),
+            )
+            self._thumb_pool.append((image_item, delete_rect, delete_text))
+        return self._thumb_pool[index]
+
+    def _set_thumb_slot(self, index: int, image: Image.Image) -> None:
+        # The 96px thumb is cached per image, so the rebuild after a delete
+        # only re-blits the surviving slots instead of re-resizing them.
+        thumb = self._thumb_pil_cache.get(id(image))
+        if thumb is None:
+            preview = self._preview_for(image)
+            scale = min(96 / preview.width, 96 / preview.height, 1.0)
+            thumb = preview.resize(
+                (max(1, int(preview.width * scale)), max(1, int(preview.height * scale))),
+                Image.BILINEAR,
+            )
+            self._thumb_pil_cache[id(image)] = thumb
+        items = self._thumb_slot(index)
+        image_item = items[0]
+
+        # Blit into the existing PhotoImage when the size matches;
+        # allocating a fresh Tk bitmap per paste is a known slow path.
+        existing = self.thumb_images[index] if index < len(self.thumb_images) else None
+        if (
+            existing is not None
+            and existing.width() == thumb.width
+            and existing.height() == thumb.height
+        ):
+            existing.paste(thumb)
+        else:
             thumb_tk = ImageTk.PhotoImage(thumb)
-            self.thumb_images.append(thumb_tk)
+            if index < len(self.thumb_images):
+                self.thumb_images[index] = thumb_tk
+            else:
+                self.thumb_images.append(thumb_tk)
+            self.thumb_canvas.itemconfigure(image_item, image=thumb_tk)
 
-            container = Frame(self.thumb_frame)
-            container.pack(side=LEFT, padx=2, pady=2)
+        for item in items:
+            self.thumb_canvas.itemconfigure(item, state="normal")
 
-            lbl = Label(container, image=thumb_tk)
-            lbl.pack(side="top")
+    def _append_thumbnail(self, image: Image.Image) -> None:
+        """Add the newest page's thumbnail without touching the others.
 
-            delete_btn = Button(
-                container,
-                text="X",
-                command=lambda idx=index - 1: self._delete_book_screenshots(idx),
-                bg="#C62828",
-                fg="white",
-                activebackground="#B71C1C",
-                activeforeground="white",
-                padx=2,
-                pady=0,
-            )
-            delete_btn.pack(side="top", fill="x")
+        The paste paths call this instead of _rebuild_thumbnails: adding
+        page N+1 fills one slot and extends the scrollregion — O(1) — where
+        a rebuild re-thumbnails all N existing pages for nothing.
+        """
+        count = len(self.page_images)
+        self._set_thumb_slot(count - 1, image)
+        self.thumb_canvas.configure(
+            scrollregion=(0, 0, count * self._THUMB_CELL, 140)
+        )
+        self.thumb_canvas.xview_moveto(1.0)
 
-        try:
-            self.thumb_canvas.update_idletasks()
-            self.thumb_canvas.configure(scrollregion=self.thumb_canvas.bbox("all"))
-        except Exception:  # noqa: BLE001
-            pass
+    def _rebuild_thumbnails(self) -> None:
+        count = len(self.page_images)
+
+        for index, image in enumerate(self.page_images):
+            self._set_thumb_slot(index, image)
+
+        # Hide (not destroy) surplus slots, detaching their bitmaps before
+        # the PhotoImage references are dropped.
+        for items in self._thumb_pool[count:]:
+            self.thumb_canvas.itemconfigure(items[0], image="", state="hidden")
+            self.thumb_canvas.itemconfigure(items[1], state="hidden")
+            self.thumb_canvas.itemconfigure(items[2], state="hidden")
+        del self.thumb_images[count:]
+
+        self.thumb_canvas.configure(
+            scrollregion=(0, 0, count * self._THUMB_CELL, 140)
+        )
+        if count:
+            # Follow the newest thumbnail.
+            self.thumb_canvas.xview_moveto(1.0)
 
     def _delete_book_screenshots(self, index: int) -> None:
         if index < 0 or index >= len(self.page_images):
             return
 
-        self.page_images.pop(index)
+        removed = self.page_images.pop(index)
+        self._evict_preview(removed)
 
         if self.page_texts:
             self.page_texts.clear()
+            self._book_context_tail = ""
             self.log(
                 "Cleared existing book transcripts because a page screenshot was deleted. "
                 "Please re-run book transcription.",
@@ -455,13 +727,58 @@ class TkApp:
             self._set_progress(0.0)
             self.log("Deleted the last BOOK page screenshot; none remain.")
 
-    def _grab_image_from_clipboard(self, *, silent: bool = False) -> Image.Image | None:
-        try:
-            data = ImageGrab.grabclipboard()
-        except Exception as exc:  # noqa: BLE001
-            if not silent:
-                self.log(f"Could not read image from clipboard: {exc}")
+    def _grab_clipboard_image_native(self) -> Image.Image | None:
+        """Read clipboard PNG bytes straight from wl-paste/xclip on Linux.
+
+        ImageGrab.grabclipboard goes through a temp file on X11/Wayland;
+        piping the bytes from the native clipboard tool keeps the whole paste
+        in memory. Returns None when no tool succeeds.
+        """
+        if not sys.platform.startswith("linux"):
             return None
+        for cmd in (
+            ["wl-paste", "--type", "image/png"],
+            ["xclip", "-selection", "clipboard", "-t", "image/png", "-o"],
+        ):
+            try:
+                proc = subprocess.run(cmd, capture_output=True, timeout=2)
+            except Exception:  # noqa: BLE001
+                continue
+            if proc.returncode != 0 or not proc.stdout:
+                continue
+            try:
+                image = Image.open(io.BytesIO(proc.stdout))
+                image.load()
+                return image
+            except Exception:  # noqa: BLE001
+                continue
+        return None
+
+    def _grab_image_from_clipboard(
+        self,
+        *,
+        silent: bool = False,
+        seq_check: bool = False,
+    ) -> Image.Image | None:
+        if seq_check and sys.platform.startswith("win"):
+            # The clipboard sequence number bumps on every change; when it
+            # has not moved since the last poll, skip serializing the DIB
+            # out of the clipboard entirely — one syscall instead.
+            import ctypes
+
+            seq = int(ctypes.windll.user32.GetClipboardSequenceNumber())
+            if seq and seq == self._last_clipboard_seq:
+                return None
+            self._last_clipboard_seq = seq
+
+        data: Image.Image | list | None = self._grab_clipboard_image_native()
+        if data is None:
+            try:
+                data = ImageGrab.grabclipboard()
+            except Exception as exc:  # noqa: BLE001
+                if not silent:
+                    self.log(f"Could not read image from clipboard: {exc}")
+                return None
 
         if data is None:
             if not silent:
@@ -474,6 +791,12 @@ class TkApp:
         elif isinstance(data, list) and data:
             try:
                 image = Image.open(data[0])
+                # For JPEG-backed clipboard files, draft() decodes at reduced
+                # IDCT precision near the size OCR actually consumes (the
+                # ocr_fast cap), several times faster than a full decode.
+                # It is a no-op for PNG and other formats.
+                image.draft("RGB", (1600, 1600))
+                image.load()
             except Exception as exc:  # noqa: BLE001
                 if not silent:
                     self.log(f"Could not open image from clipboard file: {exc}")
@@ -484,13 +807,68 @@ class TkApp:
                 self.log("Clipboard content is not an image.")
             return None
 
-        return image.convert("RGB")
+        # convert() always copies the full pixel buffer; skip it when the
+        # clipboard already delivered an RGB image.
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        return image
+
+    def _grab_screen(self, monitor: int = 1) -> Image.Image | None:
+        """Capture the full screen as an RGB image.
+
+        Prefers mss, which calls the OS capture API directly and hands back
+        a raw buffer (roughly 3x faster per grab than ImageGrab.grab);
+        falls back to ImageGrab when mss is not installed.
+        """
+        try:
+            from mss import mss
+        except ImportError:
+            mss = None
+        if mss is not None:
+            try:
+                with mss() as sct:
+                    raw = sct.grab(sct.monitors[monitor])
+                return Image.frombytes("RGB", raw.size, raw.rgb)
+            except Exception as exc:  # noqa: BLE001
+                self.log(f"mss screen capture failed; using ImageGrab: {exc}")
+        try:
+            image = ImageGrab.grab()
+        except Exception as exc:  # noqa: BLE001
+            self.log(f"Screen capture failed: {exc}")
+            return None
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        return image
+
+    def _cheap_image_fingerprint(self, image: Image.Image) -> tuple:
+        """Probe 64 fixed pixels as a pre-check before the full dHash.
 
-    def _image_signature(self, image: Image.Image) -> str:
-        thumb = image.copy()
-        thumb.thumbnail((96, 96), Image.LANCZOS)
-        payload = f"{thumb.mode}|{thumb.size[0]}x{thumb.size[1]}".encode("utf-8") + thumb.tobytes()
-        return hashlib.sha256(payload).hexdigest()
+        The dHash's 9x8 resize still walks every source pixel; when the
+        clipboard has not changed (the common idle case), comparing this
+        sample against the previous tick's skips that pass entirely.
+        """
+        w, h = image.size
+        px = image.load()
+        return (
+            image.size,
+            image.mode,
+            tuple(px[w * i // 8, h * j // 8] for i, j in _FP_POINTS),
+        )
+
+    def _image_signature(self, image: Image.Image) -> int:
+        """Return a 64-bit dHash of the image for duplicate detection.
+
+        The clipboard watchers call this every tick; a cryptographic hash of
+        a full thumbnail is overkill for telling two pastes apart. The
+        horizontal-gradient sign over a 9x8 grayscale reduction packs into a
+        single uint64 — cheaper to compute and to keep in the seen-deques.
+        """
+        arr = np.asarray(
+            image.convert("L").resize((9, 8), Image.BILINEAR),
+            dtype=np.uint8,
+        )
+        bits = arr[:, 1:] > arr[:, :-1]
+        return int(np.packbits(bits).view(np.uint64)[0])
 
     def on_toggle_easy_book_screenshot(self) -> None:
         if self.easy_book_screenshot_var.get():
@@ -514,13 +892,60 @@ class TkApp:
             self._stop_easy_quiz_clipboard_watcher()
             self.log("Easy Quiz Screenshot disabled.")
 
+    def _on_root_focus_out(self, _event=None) -> None:
+        # Pastes come from other apps, but a 5s worst-case pickup while the
+        # window is in the background beats waking the CPU 3x a second.
+        self._easy_poll_interval_ms = 5000
+
+    def _on_root_focus_in(self, _event=None) -> None:
+        self._easy_poll_interval_ms = 300
+        self._easy_empty_polls = 0
+
+    def _note_poll_result(self, found_new: bool) -> None:
+        """Back the polling interval off while nothing is arriving."""
+        if found_new:
+            self._easy_poll_interval_ms = 300
+            self._easy_empty_polls = 0
+        else:
+            self._easy_empty_polls += 1
+            if self._easy_empty_polls > 10:
+                self._easy_poll_interval_ms = min(
+                    2000, self._easy_poll_interval_ms * 2
+                )
+
+    def _start_clipboard_events(self, handler) -> bool:
+        """Prefer OS clipboard-change notifications over polling.
+
+        Returns True when the listener is active; the handler then runs once
+        per clipboard change (marshalled onto the Tk thread) and the polling
+        loop stays parked.
+        """
+        listener = ClipboardListener(lambda: self.root.after(0, handler))
+        if listener.start():
+            self._clipboard_listener = listener
+            self._clipboard_events_active = True
+            return True
+        return False
+
+    def _stop_clipboard_events(self) -> None:
+        listener = self._clipboard_listener
+        self._clipboard_listener = None
+        self._clipboard_events_active = False
+        if listener is not None:
+            listener.stop()
+
     def _start_easy_book_clipboard_watcher(self) -> None:
-        if self._easy_book_clipboard_job is not None:
+        if self._easy_book_clipboard_job is not None or self._clipboard_events_active:
             return
         self._easy_book_clipboard_last_sig = None
+        self._last_cheap_fp = None
+        self._start_clipboard_events(self._poll_easy_book_clipboard)
+        # Run one check either way: it picks up an image already on the
+        # clipboard and, in polling mode, kicks off the rescheduling loop.
         self._poll_easy_book_clipboard()
 
     def _stop_easy_book_clipboard_watcher(self) -> None:
+        self._stop_clipboard_events()
         job = self._easy_book_clipboard_job
         self._easy_book_clipboard_job = None
         if job is None:
@@ -531,14 +956,19 @@ class TkApp:
             pass
 
     def _start_easy_quiz_clipboard_watcher(self) -> None:
-        if self._easy_quiz_clipboard_job is not None:
+        if self._easy_quiz_clipboard_job is not None or self._clipboard_events_active:
             return
         self._easy_quiz_clipboard_last_sig = None
+        self._last_cheap_fp = None
+        if self._pending_quiz_image is not None:
+            self._evict_preview(self._pending_quiz_image)
         self._pending_quiz_image = None
         self._pending_quiz_sig = None
+        self._start_clipboard_events(self._poll_easy_quiz_clipboard)
         self._poll_easy_quiz_clipboard()
 
     def _stop_easy_quiz_clipboard_watcher(self) -> None:
+        self._stop_clipboard_events()
         job = self._easy_quiz_clipboard_job
         self._easy_quiz_clipboard_job = None
         if job is None:
@@ -552,6 +982,8 @@ class TkApp:
         if self._quiz_transcribing:
             return
         if not self.easy_quiz_screenshot_var.get():
+            if self._pending_quiz_image is not None:
+                self._evict_preview(self._pending_quiz_image)
             self._pending_quiz_image = None
             self._pending_quiz_sig = None
             return
@@ -566,7 +998,7 @@ class TkApp:
         if image is None:
             return
 
-        self.quiz_image = image
+        self._set_quiz_image(image)
         self._show_last_image(image)
         if sig is not None:
             self._easy_quiz_clipboard_last_sig = sig
@@ -582,61 +1014,135 @@ class TkApp:
             self._easy_quiz_clipboard_job = None
             return
 
+        # The grab (subprocess / DIB serialization) and the hash run on a
+        # short-lived worker thread so the Tk loop never blocks on them;
+        # only the UI mutation hops back. The in-flight flag keeps a slow
+        # grab from stacking workers.
+        if not self._quiz_poll_in_flight:
+            self._quiz_poll_in_flight = True
+            threading.Thread(
+                target=self._poll_easy_quiz_worker,
+                name="quiz-clip-poll",
+                daemon=True,
+            ).start()
+
+        if self._clipboard_events_active:
+            self._easy_quiz_clipboard_job = None
+        else:
+            self._easy_quiz_clipboard_job = self.root.after(
+                self._easy_poll_interval_ms, self._poll_easy_quiz_clipboard
+            )
+
+    def _poll_easy_quiz_worker(self) -> None:
+        image: Image.Image | None = None
+        sig: int | None = None
         try:
-            image = self._grab_image_from_clipboard(silent=True)
+            image = self._grab_image_from_clipboard(silent=True, seq_check=True)
             if image is not None:
-                sig = self._image_signature(image)
-                if sig != self._easy_quiz_clipboard_last_sig and sig not in self._easy_quiz_clipboard_seen:
-                    if self._quiz_transcribing:
-                        if self._pending_quiz_sig != sig:
-                            self._pending_quiz_image = image
-                            self._pending_quiz_sig = sig
-                            self.log(
-                                "Queued QUIZ screenshot from clipboard (easy mode); will process after current OCR completes.",
-                            )
-                    else:
-                        self._easy_quiz_clipboard_last_sig = sig
-                        self._easy_quiz_clipboard_seen.append(sig)
-                        self.quiz_image = image
-                        self._show_last_image(image)
-                        self.log(
-                            f"Pasted QUIZ screenshot from clipboard (easy mode) ({image.width}x{image.height}).",
-                        )
-                        self.root.after(0, self.on_transcribe_quiz)
+                fp = self._cheap_image_fingerprint(image)
+                if fp == self._last_cheap_fp:
+                    image = None
+                else:
+                    self._last_cheap_fp = fp
+                    sig = self._image_signature(image)
+        except Exception:  # noqa: BLE001
+            image = None
         finally:
-            self._easy_quiz_clipboard_job = self.root.after(350, self._poll_easy_quiz_clipboard)
+            self._quiz_poll_in_flight = False
+        self.root.after(0, lambda: self._apply_easy_quiz_result(image, sig))
+
+    def _apply_easy_quiz_result(self, image: Image.Image | None, sig: int | None) -> None:
+        if not self.easy_quiz_screenshot_var.get():
+            return
+        self._note_poll_result(False)
+        if image is None or sig is None:
+            return
+        if sig != self._easy_quiz_clipboard_last_sig and sig not in self._easy_quiz_clipboard_seen:
+            self._note_poll_result(True)
+            if self._quiz_transcribing:
+                if self._pending_quiz_sig != sig:
+                    if self._pending_quiz_image is not None:
+                        self._evict_preview(self._pending_quiz_image)
+                    self._pending_quiz_image = image
+                    self._pending_quiz_sig = sig
+                    self.log(
+                        "Queued QUIZ screenshot from clipboard (easy mode); will process after current OCR completes.",
+                    )
+            else:
+                self._easy_quiz_clipboard_last_sig = sig
+                self._easy_quiz_clipboard_seen.append(sig)
+                self._set_quiz_image(image)
+                self._show_last_image(image)
+                self.log(
+                    f"Pasted QUIZ screenshot from clipboard (easy mode) ({image.width}x{image.height}).",
+                )
+                self.root.after(0, self.on_transcribe_quiz)
 
     def _poll_easy_book_clipboard(self) -> None:
         if not self.easy_book_screenshot_var.get():
             self._easy_book_clipboard_job = None
             return
 
+        if not self._book_poll_in_flight:
+            self._book_poll_in_flight = True
+            threading.Thread(
+                target=self._poll_easy_book_worker,
+                name="book-clip-poll",
+                daemon=True,
+            ).start()
+
+        if self._clipboard_events_active:
+            self._easy_book_clipboard_job = None
+        else:
+            self._easy_book_clipboard_job = self.root.after(
+                self._easy_poll_interval_ms, self._poll_easy_book_clipboard
+            )
+
+    def _poll_easy_book_worker(self) -> None:
+        image: Image.Image | None = None
+        sig: int | None = None
         try:
-            image = self._grab_image_from_clipboard(silent=True)
+            image = self._grab_image_from_clipboard(silent=True, seq_check=True)
             if image is not None:
-                if len(self.page_images) >= self.config.max_book_screenshots:
-                    self.easy_book_screenshot_var.set(False)
-                    self._stop_easy_book_clipboard_watcher()
-                    self.log(
-                        f"Reached {self.config.max_book_screenshots} BOOK screenshots; Easy Book Screenshot has been disabled. "
-                        "Use Clear BOOK Screenshots / Clear All to reset.",
-                    )
-                    return
-
-                sig = self._image_signature(image)
-                if sig != self._easy_book_clipboard_last_sig and sig not in self._easy_book_clipboard_seen:
-                    self._easy_book_clipboard_last_sig = sig
-                    self._easy_book_clipboard_seen.append(sig)
-                    self.page_images.append(image)
-                    index = len(self.page_images)
-                    self._show_last_image(image)
-                    self.log(
-                        f"Added BOOK page screenshot #{index} from clipboard (easy mode) "
-                        f"({image.width}x{image.height}).",
-                    )
-                    self._rebuild_thumbnails()
+                fp = self._cheap_image_fingerprint(image)
+                if fp == self._last_cheap_fp:
+                    image = None
+                else:
+                    self._last_cheap_fp = fp
+                    sig = self._image_signature(image)
+        except Exception:  # noqa: BLE001
+            image = None
         finally:
-            self._easy_book_clipboard_job = self.root.after(350, self._poll_easy_book_clipboard)
+            self._book_poll_in_flight = False
+        self.root.after(0, lambda: self._apply_easy_book_result(image, sig))
+
+    def _apply_easy_book_result(self, image: Image.Image | None, sig: int | None) -> None:
+        if not self.easy_book_screenshot_var.get():
+            return
+        self._note_poll_result(False)
+        if image is None or sig is None:
+            return
+        if len(self.page_images) >= self.config.max_book_screenshots:
+            self.easy_book_screenshot_var.set(False)
+            self._stop_easy_book_clipboard_watcher()
+            self.log(
+                f"Reached {self.config.max_book_screenshots} BOOK screenshots; Easy Book Screenshot has been disabled. "
+                "Use Clear BOOK Screenshots / Clear All to reset.",
+            )
+            return
+
+        if sig != self._easy_book_clipboard_last_sig and sig not in self._easy_book_clipboard_seen:
+            self._note_poll_result(True)
+            self._easy_book_clipboard_last_sig = sig
+            self._easy_book_clipboard_seen.append(sig)
+            self.page_images.append(image)
+            index = len(self.page_images)
+            self._show_last_image(image)
+            self.log(
+                f"Added BOOK page screenshot #{index} from clipboard (easy mode) "
+                f"({image.width}x{image.height}).",
+            )
+            self._append_thumbnail(image)
 
     def on_paste_screenshot(self) -> None:
         if len(self.page_images) >= self.config.max_book_screenshots:
@@ -659,7 +1165,32 @@ class TkApp:
 
         # Also add a small thumbnail to the thumbnail strip so all pasted
         # screenshots are visible in the UI.
-        self._rebuild_thumbnails()
+        self._append_thumbnail(image)
+
+        # Precompute the OCR-ready array while the user grabs the next page;
+        # the Transcribe step then finds everything already converted.
+        self._run_in_background(lambda: self._ocr_array_for(image))
+
+    def on_capture_screen(self) -> None:
+        if len(self.page_images) >= self.config.max_book_screenshots:
+            self.log(
+                f"Reached {self.config.max_book_screenshots} BOOK screenshots; cannot capture more. "
+                "Use Clear BOOK Screenshots / Clear All to reset, or increase MAX_BOOK_SCREENSHOTS in .env.",
+            )
+            return
+
+        image = self._grab_screen()
+        if image is None:
+            return
+
+        self.page_images.append(image)
+        index = len(self.page_images)
+        self._show_last_image(image)
+        self.log(
+            f"Captured BOOK page screenshot #{index} ({image.width}x{image.height}).",
+        )
+        self._append_thumbnail(image)
+        self._run_in_background(lambda: self._ocr_array_for(image))
 
     def on_clear_book_screenshots(self) -> None:
         if self._book_transcribing:
@@ -676,10 +1207,12 @@ class TkApp:
 
         self.page_images.clear()
         self.page_texts.clear()
+        self._book_context_tail = ""
         self.thumb_images.clear()
-
-        for widget in self.thumb_frame.winfo_children():
-            widget.destroy()
+        self._preview_cache.clear()
+        self._thumb_pil_cache.clear()
+        self._ocr_array_cache.clear()
+        self._rebuild_thumbnails()
 
         self._last_image_tk = None
         self.image_label.configure(image="", text="No screenshots pasted yet.")
@@ -699,9 +1232,12 @@ class TkApp:
 
         self.page_images.clear()
         self.page_texts.clear()
+        self._book_context_tail = ""
         self.thumb_images.clear()
-        for widget in self.thumb_frame.winfo_children():
-            widget.destroy()
+        self._preview_cache.clear()
+        self._thumb_pil_cache.clear()
+        self._ocr_array_cache.clear()
+        self._rebuild_thumbnails()
 
         self.quiz_image = None
         self.quiz_text = None
@@ -729,17 +1265,20 @@ class TkApp:
             self.log("No book transcript available yet. Transcribe book screenshots first.")
             return
 
-        parts: list[str] = []
-        for index, text in enumerate(self.page_texts, start=1):
-            display_text = (text or "").strip() or "(no text detected)"
-            parts.append(f"Transcript page {index}:\n{display_text}")
-
-        full_text = "\n\n".join(parts)
+        # Generator feed: join consumes the formatted pages as they are
+        # produced instead of staging them all in a throwaway list.
+        full_text = "\n\n".join(
+            f"Transcript page {index}:\n{(text or '').strip() or '(no text detected)'}"
+            for index, text in enumerate(self.page_texts, start=1)
+        )
 
         try:
             self.root.clipboard_clear()
             self.root.clipboard_append(full_text)
-            self.root.update()
+            # update() would pump the whole event queue (and can re-enter
+            # handlers); flushing idle tasks is enough to hand the selection
+            # to the clipboard owner.
+            self.root.update_idletasks()
         except Exception as exc:  # noqa: BLE001
             self.log(f"Failed to copy book transcript to clipboard: {exc}")
             return
@@ -751,7 +1290,7 @@ class TkApp:
         if image is None:
             return
 
-        self.quiz_image = image
+        self._set_quiz_image(image)
         self._show_last_image(image)
         self.log(
             f"Pasted QUIZ screenshot ({image.width}x{image.height}).",
@@ -760,31 +1299,47 @@ class TkApp:
     def log(self, message: str) -> None:
         logging.info(message)
 
-        lower = message.lower()
-        if any(keyword in lower for keyword in ["error:", "failed", "exception", "could not"]):
-            tag = "log_error"
-        elif "quiz" in lower or "=== quiz" in lower:
-            tag = "log_quiz"
-        elif "transcript page" in lower or "transcription" in lower or "ocr" in lower:
+        # Transcript pages dominate log volume during OCR and always carry
+        # this exact prefix; skip the lowercase copy and the classifier runs.
+        if message.startswith("Transcript page"):
             tag = "log_book"
-        elif any(
-            lower.startswith(prefix)
-            for prefix in (
-                "initializing",
-                "opening slz",
-                "browser is not running",
-                "configuration loaded",
-                "chrome webdriver initialized",
-            )
-        ):
-            tag = "log_status"
         else:
-            tag = "log_info"
-
-        def _update() -> None:
-            self._append_log(message, tag)
-
-        self.root.after(0, _update)
+            lower = message.lower()
+            for pattern, tag in _LOG_TAG_RES:
+                if pattern.search(lower):
+                    break
+            else:
+                tag = "log_info"
+
+        # Coalesce bursts: queue the line and schedule at most one flush per
+        # ~50ms instead of one after(0) round-trip per line, so verbose phases
+        # do not flood the Tk event loop.
+        self._log_queue.append((message, tag))
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after(50, self._flush_log_queue)
+
+    def _flush_log_queue(self) -> None:
+        self._log_flush_scheduled = False
+        if not self._log_queue:
+            return
+        # Only autoscroll when the view is already at the bottom, so a user
+        # reading older output is not yanked down by new lines.
+        follow = self.log_text.yview()[1] >= 1.0
+        last_message = ""
+        self.log_text.configure(state="normal")
+        while self._log_queue:
+            message, tag = self._log_queue.popleft()
+            self.log_text.insert(END, message + "\n", (tag,))
+            last_message = message
+        # Cap history; without a bound, insert/see cost grows with session
+        # length. "end - N lines" resolves to "1.0" when under the cap, making
+        # the delete a no-op.
+        self.log_text.delete("1.0", f"{END} - {self._LOG_MAX_LINES} lines")
+        if follow:
+            self.log_text.see(END)
+        self.log_text.configure(state="disabled")
+        self.status_label.configure(text=last_message)
 
     def _run_in_background(self, func) -> None:
         def _wrapper() -> None:
@@ -794,11 +1349,21 @@ class TkApp:
                 self.log(f"Error: {exc}")
                 self.log(traceback.format_exc())
 
-        thread = threading.Thread(target=_wrapper, daemon=True)
-        thread.start()
+        self._bg_pool.submit(_wrapper)
+
+    def _warm_ocr_reader(self) -> None:
+        # This import also carries the set_ocr_gpu call that used to live in
+        # __init__; both happen off the UI thread now.
+        from automation.workflows import _get_ocr_reader, set_ocr_gpu
+
+        set_ocr_gpu(self.config.automation.ocr_gpu)
+        if _get_ocr_reader() is not None:
+            self.log("OCR ready.")
 
     def on_launch(self) -> None:
         def task() -> None:
+            from automation.browser import create_driver
+
             if self.driver is None:
                 self.log("Initializing Chrome WebDriver...")
                 selected = (self.driver_mode_var.get() or "Auto").strip()
@@ -826,6 +1391,8 @@ class TkApp:
             self.log(
                 "Filling SLZ login form in Chrome using SLZ_USERNAME/SLZ_PASSWORD from environment.",
             )
+            from automation.workflows import fill_login_form
+
             assert self.driver is not None
             fill_login_form(self.driver, self.config)
 
@@ -855,10 +1422,13 @@ class TkApp:
             except Exception:  # noqa: BLE001
                 pass
 
+            # A single script walks the top document and every same-origin
+            # iframe recursively in-browser, so each poll costs one WebDriver
+            # round-trip instead of one per frame (switch_to.frame + script).
             script = """
 return (function(fromVal, toVal) {
-  function setVal(selector, value) {
-    var el = document.querySelector(selector);
+  function setVal(doc, selector, value) {
+    var el = doc.querySelector(selector);
     if (!el) { return false; }
     try { el.focus(); } catch (e) {}
     try {
@@ -881,61 +1451,48 @@ return (function(fromVal, toVal) {
   var fromSelectors = "input[name='lexileStart'], input[id='exampleInputEmail1']";
   var toSelectors = "input[name='lexileEnd'], input[id='exampleInputPassword1']";
 
-  var okFrom = setVal(fromSelectors, fromVal);
-  var okTo = setVal(toSelectors, toVal);
+  function walk(doc) {
+    var okFrom = setVal(doc, fromSelectors, fromVal);
+    var okTo = setVal(doc, toSelectors, toVal);
+    if (okFrom && okTo) { return true; }
+    var frames = doc.querySelectorAll('iframe');
+    for (var i = 0; i < frames.length; i++) {
+      try {
+        var inner = frames[i].contentDocument;
+        if (inner && walk(inner)) { return true; }
+      } catch (e) {}  // cross-origin frame; skip
+    }
+    return false;
+  }
 
-  return { okFrom: okFrom, okTo: okTo };
+  return walk(document);
 })(arguments[0], arguments[1]);
 """
 
+            try:
+                self.driver.switch_to.default_content()
+            except Exception:  # noqa: BLE001
+                pass
+
             deadline = time.time() + 10.0
             success = False
             last_error: Exception | None = None
 
+            # Exponential backoff: a form that renders just after the first
+            # attempt is caught within tens of milliseconds instead of half a
+            # second, while a slow page settles into 400 ms polls.
+            delay = 0.025
             while time.time() < deadline and not success:
                 try:
-                    self.driver.switch_to.default_content()
-
-                    try:
-                        result = self.driver.execute_script(script, lexile_from, lexile_to)
-                    except Exception as exc:  # noqa: BLE001
-                        last_error = exc
-                        result = None
-
-                    ok_from = bool(result and result.get("okFrom"))
-                    ok_to = bool(result and result.get("okTo"))
-
-                    if ok_from and ok_to:
-                        success = True
-                    else:
-                        frames = self.driver.find_elements(By.TAG_NAME, "iframe")
-                        for frame in frames:
-                            try:
-                                self.driver.switch_to.default_content()
-                                self.driver.switch_to.frame(frame)
-                                result = self.driver.execute_script(
-                                    script,
-                                    lexile_from,
-                                    lexile_to,
-                                )
-                                ok_from = bool(result and result.get("okFrom"))
-                                ok_to = bool(result and result.get("okTo"))
-                                if ok_from and ok_to:
-                                    success = True
-                                    break
-                            except Exception as exc:  # noqa: BLE001
-                                last_error = exc
-
-                    if not success:
-                        time.sleep(0.5)
+                    success = bool(
+                        self.driver.execute_script(script, lexile_from, lexile_to),
+                    )
                 except Exception as exc:  # noqa: BLE001
                     last_error = exc
-                    time.sleep(0.5)
 
-            try:
-                self.driver.switch_to.default_content()
-            except Exception:  # noqa: BLE001
-                pass
+                if not success:
+                    time.sleep(delay)
+                    delay = min(0.4, delay * 2)
 
             if success:
                 self.log(
@@ -969,6 +1526,8 @@ return (function(fromVal, toVal) {
                 )
                 return
 
+            from automation.workflows import _get_ocr_reader
+
             reader = _get_ocr_reader()
             if reader is None:
                 self.log("OCR is not available (easyocr failed to initialize).")
@@ -986,43 +1545,245 @@ return (function(fromVal, toVal) {
 
             self.root.after(0, _set_running)
 
-            texts: list[str] = []
-
-            for index, image in enumerate(self.page_images, start=1):
-                if self._stop_reading:
-                    self.log(
-                        "Stop requested; transcription will stop after current page.",
-                    )
-                    break
-
-                try:
-                    img_np = np.array(image)
-                except Exception as exc:  # noqa: BLE001
-                    self.log(f"Failed to prepare image {index} for OCR: {exc}")
-                    text = ""
-                else:
-                    try:
-                        lines = reader.readtext(
-                            img_np,
-                            detail=0,
-                            paragraph=True,
-                        ) or []
-                        text = "\n".join(
-                            line.strip() for line in lines if isinstance(line, str)
-                        ).strip()
-                    except Exception as exc:  # noqa: BLE001
-                        self.log(f"OCR failed for screenshot {index}: {exc}")
-                        text = ""
-
-                texts.append(text)
-
-                display_text = (text or "").strip() or "(no text detected)"
-                # Log the full transcription for this page (multi-line).
-                self.log(f"Transcript page {index}:\n{display_text}")
-
-                self._set_progress(index / float(total))
+            # Preallocated so pages are written by index; `done` tracks how
+            # many were actually transcribed (a stop leaves the tail unused).
+            texts: list[str] = [""] * total
+            done = 0
+
+            def _join_lines(lines) -> str:
+                # detail=0 guarantees a list of strings; one pass strips and
+                # drops empties without per-element isinstance checks or a
+                # second strip over the joined text.
+                return "\n".join(
+                    s for s in (line.strip() for line in (lines or [])) if s
+                )
 
+            # Progress is reported in whole percent; the division is hoisted
+            # out of the loop and unchanged percentages schedule nothing.
+            inv_total = 1.0 / total
+            last_pct = -1
+            if (
+                self.config.automation.ocr_parallel_pages
+                and not self.config.automation.ocr_gpu
+            ):
+                # CPU backend: torch releases the GIL inside its kernels, so
+                # pages can run concurrently across cores. Results are
+                # consumed in submission order to keep the transcript stable;
+                # a stop request cancels whatever has not started yet.
+                workers = min(4, os.cpu_count() or 1)
+                with ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="ocr"
+                ) as ocr_executor:
+                    futures = []
+                    keys: list[bytes | None] = []
+                    for image in self.page_images:
+                        img_np = self._ocr_array_for(image)
+                        if self._looks_blank(img_np):
+                            # Blank pages skip the queue; they are reported
+                            # as "(no text detected)" below.
+                            futures.append(None)
+                            keys.append(None)
+                            continue
+                        key = self._ocr_cache_key(img_np)
+                        keys.append(key)
+                        hit = self._ocr_cache_get(key)
+                        if hit is not None:
+                            # Cached transcript rides along as a plain string.
+                            futures.append(hit)
+                            continue
+                        futures.append(
+                            ocr_executor.submit(
+                                reader.readtext,
+                                img_np,
+                                detail=0,
+                                paragraph=True,
+                            )
+                        )
+                    for index, future in enumerate(futures, start=1):
+                        if self._stop_reading:
+                            for pending in futures[index - 1 :]:
+                                if pending is not None and not isinstance(pending, str):
+                                    pending.cancel()
+                            self.log(
+                                "Stop requested; transcription stopped.",
+                            )
+                            break
+                        if future is None:
+                            text = ""
+                        elif isinstance(future, str):
+                            text = future
+                        else:
+                            try:
+                                text = _join_lines(future.result())
+                            except Exception as exc:  # noqa: BLE001
+                                self.log(
+                                    f"OCR failed for screenshot {index}: {exc}",
+                                )
+                                text = ""
+                            else:
+                                key = keys[index - 1]
+                                if key is not None:
+                                    self._ocr_cache_put(key, text)
+                        texts[index - 1] = text
+                        done = index
+                        display_text = text.strip() or "(no text detected)"
+                        self.log(f"Transcript page {index}:\n{display_text}")
+                        pct = int(index * inv_total * 100.0)
+                        if pct != last_pct:
+                            last_pct = pct
+                            self._set_progress(pct / 100.0)
+            else:
+                # Pages are OCRed in small batches: equally sized screenshots go
+                # through readtext_batched in one shot, so the detector and
+                # recognizer run over a batched tensor instead of paying per-call
+                # setup N times. Stop requests are honored between batches.
+                batch_size = 4
+
+                def _prepare_batch(batch_start: int) -> list:
+                    arrays = []
+                    batch = self.page_images[batch_start : batch_start + batch_size]
+                    for offset, image in enumerate(batch):
+                        try:
+                            # Usually a cache hit: the array was computed in the
+                            # background when the page was pasted.
+                            img_np = self._ocr_array_for(image)
+                        except Exception as exc:  # noqa: BLE001
+                            self.log(
+                                f"Failed to prepare image {batch_start + offset + 1} for OCR: {exc}",
+                            )
+                            arrays.append(None)
+                            continue
+                        if self._looks_blank(img_np):
+                            self.log(
+                                f"Screenshot {batch_start + offset + 1} looks blank; skipping OCR.",
+                            )
+                            arrays.append(None)
+                        else:
+                            arrays.append(img_np)
+                    return arrays
+
+                # Two-stage pipeline: while the reader works on batch i, a helper
+                # thread prepares the arrays for batch i+1, so preparation hides
+                # under inference (which releases the GIL inside torch kernels).
+                prep_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ocr-prep")
+                next_arrays = prep_executor.submit(_prepare_batch, 0)
+
+                for start in range(0, total, batch_size):
+                    if self._stop_reading:
+                        self.log(
+                            "Stop requested; transcription will stop after current batch.",
+                        )
+                        break
+
+                    arrays = next_arrays.result()
+                    if start + batch_size < total:
+                        next_arrays = prep_executor.submit(_prepare_batch, start + batch_size)
+
+                    keys = [
+                        None if arr is None else self._ocr_cache_key(arr)
+                        for arr in arrays
+                    ]
+                    cached = [
+                        None if key is None else self._ocr_cache_get(key)
+                        for key in keys
+                    ]
+                    valid = [arr for arr in arrays if arr is not None]
+                    batch_results: list[str] | None = None
+                    if all(
+                        arr is None or hit is not None
+                        for arr, hit in zip(arrays, cached)
+                    ):
+                        # Every page in this batch was OCRed before with the
+                        # same pixels; serve the transcripts from the cache.
+                        batch_results = [hit or "" for hit in cached]
+                    elif (
+                        len(valid) == len(arrays)
+                        and len(valid) > 1
+                        and len({arr.shape[:2] for arr in valid}) == 1
+                        and hasattr(reader, "readtext_batched")
+                    ):
+                        try:
+                            results = reader.readtext_batched(
+                                valid,
+                                detail=0,
+                                paragraph=True,
+                                batch_size=len(valid),
+                            )
+                            batch_results = [_join_lines(lines) for lines in results]
+                        except Exception as exc:  # noqa: BLE001
+                            self.log(f"Batched OCR failed; falling back per page: {exc}")
+                            batch_results = None
+
+                    if batch_results is None:
+                        batch_results = []
+                        for offset, img_np in enumerate(arrays):
+                            if img_np is None:
+                                batch_results.append("")
+                                continue
+                            try:
+                                batch_results.append(
+                                    _join_lines(
+                                        reader.readtext(img_np, detail=0, paragraph=True)
+                                    )
+                                )
+                            except Exception as exc:  # noqa: BLE001
+                                self.log(
+                                    f"OCR failed for screenshot {start + offset + 1}: {exc}",
+                                )
+                                batch_results.append("")
+
+                    for key, text in zip(keys, batch_results):
+                        if key is not None:
+                            self._ocr_cache_put(key, text)
+
+                    for offset, text in enumerate(batch_results):
+                        texts[start + offset] = text
+                        display_text = (text or "").strip() or "(no text detected)"
+                        # Log the full transcription for this page (multi-line).
+                        self.log(f"Transcript page {start + offset + 1}:\n{display_text}")
+                    done = start + len(batch_results)
+
+                    pct = int(done * inv_total * 100.0)
+                    if pct != last_pct:
+                        last_pct = pct
+                        self._set_progress(pct / 100.0)
+
+                prep_executor.shutdown(wait=False)
+            if done < total:
+                # Stopped early: keep only the pages that were transcribed.
+                texts = texts[:done]
             self.page_texts = texts
+            joined = "\n\n".join(texts).strip()
+            if len(joined) > 4000:
+                tail = joined[-4000:]
+                # Drop the leading partial sentence so the LLM context starts
+                # clean instead of mid-word.
+                cut = tail.find(". ")
+                self._book_context_tail = tail[cut + 2 :] if cut != -1 else tail
+            else:
+                self._book_context_tail = joined
+            # The OCR-ready arrays have served their purpose; dropping them
+            # keeps resident memory bounded over long multi-chapter sessions
+            # (they are recomputed on demand if transcription is re-run).
+            self._ocr_array_cache.clear()
+            if (
+                self.config.automation.release_page_images
+                and not self._stop_reading
+                and len(texts) == total
+            ):
+                # From here on the quiz only needs page_texts; swap the
+                # full-res pages for 512px copies so GC can reclaim the big
+                # RGB buffers (a 4K page holds ~24 MB of pixels, its 512px
+                # copy well under 1 MB).
+                for i, image in enumerate(self.page_images):
+                    if max(image.size) <= 512:
+                        continue
+                    small = image.copy()
+                    small.thumbnail((512, 512), Image.LANCZOS)
+                    self._evict_preview(image)
+                    self.page_images[i] = small
+                self.root.after(0, self._rebuild_thumbnails)
+                self.log("Released full-resolution page screenshots.")
             self._book_transcribing = False
 
             def _reset_button() -> None:
@@ -1063,6 +1824,8 @@ return (function(fromVal, toVal) {
             try:
                 self.root.after(0, _set_busy)
 
+                from automation.workflows import _get_ocr_reader
+
                 self.log("Starting OCR transcription for QUIZ screenshot.")
                 reader = _get_ocr_reader()
                 if reader is None:
@@ -1070,26 +1833,44 @@ return (function(fromVal, toVal) {
                     return
 
                 try:
-                    img_np = np.array(self.quiz_image)
+                    # Same grayscale/downscale treatment as book pages; a 4K
+                    # quiz screenshot blows up detector time quadratically.
+                    original_size = self.quiz_image.size
+                    img_np = self._ocr_array_for(self.quiz_image)
+                    if img_np.shape[1] < original_size[0]:
+                        self.log(
+                            f"Downscaled quiz screenshot {original_size[0]}x{original_size[1]} "
+                            f"-> {img_np.shape[1]}x{img_np.shape[0]} for OCR.",
+                        )
                 except Exception as exc:  # noqa: BLE001
                     self.log(f"Failed to prepare quiz image for OCR: {exc}")
                     return
 
-                try:
-                    lines = reader.readtext(
-                        img_np,
-                        detail=0,
-                        paragraph=True,
-                    ) or []
-                    text = "\n".join(
-                        line.strip() for line in lines if isinstance(line, str)
-                    ).strip()
-                except Exception as exc:  # noqa: BLE001
-                    self.log(f"OCR failed for quiz screenshot: {exc}")
-                    text = ""
+                cache_key = self._ocr_cache_key(img_np)
+                cached = self._ocr_cache_get(cache_key)
+                if cached is not None:
+                    self.log("Quiz OCR served from cache.")
+                    text = cached
+                else:
+                    try:
+                        lines = reader.readtext(
+                            img_np,
+                            detail=0,
+                            paragraph=True,
+                        ) or []
+                        # detail=0 guarantees a list of strings; strip and
+                        # drop empties in one pass like the book path does.
+                        text = "\n".join(
+                            s for s in (line.strip() for line in lines) if s
+                        )
+                    except Exception as exc:  # noqa: BLE001
+                        self.log(f"OCR failed for quiz screenshot: {exc}")
+                        text = ""
+                    else:
+                        self._ocr_cache_put(cache_key, text)
 
                 self.quiz_text = text
-                display_text = (text or "").strip() or "(no text detected)"
+                display_text = text or "(no text detected)"
                 self.log(f"Quiz OCR text:\n{display_text}")
 
                 # Automatically ask the AI to answer this quiz using the current
@@ -1109,23 +1890,36 @@ return (function(fromVal, toVal) {
         self._run_in_background(task)
 
     def _parse_quiz_text(self, text: str) -> tuple[str, list[str]]:
-        lines = [line.strip() for line in (text or "").splitlines()]
-        non_empty = [line for line in lines if line]
+        # One pass builds the stripped non-empty lines and their option
+        # matches together; the matches feed both the letter-option
+        # detection and the main loop below. The regex only runs on true
+        # candidates — a line can only match when it starts with an
+        # uppercase letter followed by "." or ")", and two C-level set
+        # lookups reject everything else.
+        non_empty: list[str] = []
+        option_matches: list[re.Match[str] | None] = []
+        for raw in (text or "").splitlines():
+            line = raw.strip()
+            if not line:
+                continue
+            non_empty.append(line)
+            option_matches.append(
+                _OPTION_RE.match(line)
+                if len(line) >= 2 and line[0] in _OPT_LETTERS and line[1] in ".)"
+                else None,
+            )
 
         if not non_empty:
             return "", []
 
-        option_pattern = re.compile(r"^([A-Z])[\.\)]\s*(.*)$")
-
-        # First, check if we have any lines that look like "A. ...", "B) ..." etc.
-        has_letter_options = any(option_pattern.match(line) for line in non_empty)
+        has_letter_options = any(option_matches)
 
         # Fallback mode: no explicit A/B/C labels detected. Treat the first line as
         # the question and each subsequent non-empty line as an option.
         if not has_letter_options:
             # Strip any leading numeric index like "1" or "1." from the question line.
             first = non_empty[0]
-            m = re.match(r"^\d+[\).]?\s*(.*)$", first)
+            m = _QNUM_RE.match(first)
             question = (m.group(1) if m and m.group(1) else first).strip()
 
             candidate_options = non_empty[1:]
@@ -1149,8 +1943,7 @@ return (function(fromVal, toVal) {
         current_option: list[str] = []
         in_options = False
 
-        for line in non_empty:
-            match = option_pattern.match(line)
+        for line, match in zip(non_empty, option_matches):
             if match and match.group(1) in ("A", "B", "C", "D", "E", "F"):
                 if current_option:
                     options.append(" ".join(current_option).strip())
@@ -1192,10 +1985,9 @@ return (function(fromVal, toVal) {
                 return
 
             if self.page_texts:
-                context = "\n\n".join(self.page_texts).strip()
-                if len(context) > 4000:
-                    context = context[-4000:]
-                book_context = context
+                # Joined and trimmed once when transcription finished; quizzes
+                # on long books would otherwise re-join the full text per click.
+                book_context = self._book_context_tail
                 self.log("Using transcribed book text as context for quiz answer.")
             else:
                 book_context = None
@@ -1203,28 +1995,23 @@ return (function(fromVal, toVal) {
                     "No transcribed book text available; quiz answer will use quiz text only.",
                 )
 
-            if book_context:
-                augmented_question = (
-                    "Use the following book transcript to answer the quiz question.\n\n"
-                    f"Book transcript:\n{book_context}\n\n"
-                    f"Quiz question:\n{question}"
-                )
-            else:
-                augmented_question = question
+            if self._llm_client is None:
+                from ai.remote_client import RemoteLLMClient
 
-            llm_client = RemoteLLMClient(self.config.llm)
+                self._llm_client = RemoteLLMClient(self.config.llm)
+            llm_client = self._llm_client
 
             try:
-                suggestion = llm_client.choose_answer(augmented_question, options)
+                suggestion = llm_client.choose_answer(question, options, context=book_context)
             except Exception as exc:  # noqa: BLE001
                 self.log(f"Error while asking AI to answer quiz: {exc}")
                 return
 
             # Try to detect which option letter the model selected (e.g. "B." or "C)").
             chosen_letter: str | None = None
-            match = re.search(r"\b([A-F])[\).]\b", suggestion)
+            match = _LETTER_PUNCT_RE.search(suggestion)
             if not match:
-                match = re.search(r"\b([A-F])\b", suggestion)
+                match = _LETTER_RE.search(suggestion)
             if match:
                 chosen_letter = match.group(1)
 
@@ -1257,6 +2044,7 @@ return (function(fromVal, toVal) {
             self.root.after(0, self._stop_easy_book_clipboard_watcher)
             self.root.after(0, self._stop_easy_quiz_clipboard_watcher)
             self.root.after(0, self.root.destroy)
+            self._bg_pool.shutdown(wait=False)
 
         self._run_in_background(task)
 